@@ -2,50 +2,46 @@ import re
 from typing import TYPE_CHECKING
 
 from petty.events import subscribe
-from petty.protocol.datatypes import Buffer, String, TextComponent, VarInt
-from plugins.commands import Command, CommandException, CommandGroup, CommandsPlugin
+from petty.protocol.datatypes import Buffer, TextComponent
+from plugins.commands import (
+    Command,
+    CommandException,
+    CommandGroup,
+    CommandRegistry,
+    CommandsPlugin,
+)
 
 if TYPE_CHECKING:
     from broadcasting.plugin import BroadcastPeerPlugin
 
+_FORMAT_CODE = re.compile(r"§.")
+
 
 class BroadcastPeerCommandsPlugin(CommandsPlugin):
     async def _run_command(self: BroadcastPeerPlugin, message: str):
-        segments = message.split()
-        cmd_name = segments[0].removeprefix("/").removeprefix("/").casefold()
+        # only the command token is needed to look the command up;
+        # the arguments are split once we know it's one of ours
+        head, _, rest = message.partition(" ")
+        # strip a leading / or // in one slice
+        n_slashes = 2 if head.startswith("//") else 1 if head.startswith("/") else 0
+        cmd_name = head[n_slashes:]
 
         command: Command | CommandGroup | None = self.command_registry.get(cmd_name)
 
         if command:
             try:
-                args = segments[1:]
+                args = rest.split()
                 output: str | TextComponent = await command(self, args)
             except CommandException as err:
-                if isinstance(err.message, TextComponent):
-                    err.message.flatten()
-
-                    for i, child in enumerate(err.message.get_children()):
-                        if not child.data.get("color"):
-                            err.message.replace_child(i, child.color("dark_red"))
-                        if not child.data.get("bold"):
-                            err.message.replace_child(i, child.bold(False))
-
-                err.message = TextComponent(err.message)
-                if not err.message.data.get("color"):
-                    err.message.color("dark_red")
-
-                err.message = err.message.bold(False)
-
-                error_msg = TextComponent("∎ ").bold().color("blue").append(err.message)
-                if error_msg.data.get("clickEvent") is None:
-                    error_msg = error_msg.click_event("suggest_command", message)
-
-                self.downstream.chat(error_msg)
+                self.downstream.chat(err.to_component(message))
             else:
                 if output:
-                    if segments[0].startswith("//"):  # send output of command
-                        # remove chat formatting
-                        output = re.sub(r"§.", "", str(output))
+                    if n_slashes == 2:  # send output of command
+                        # remove chat formatting; str() of a TextComponent is already plain
+                        if isinstance(output, str):
+                            output = _FORMAT_CODE.sub("", output)
+                        else:
+                            output = str(output)
                         self.proxy.bc_chat(self.username, output)
                     else:
                         if isinstance(output, TextComponent):
@@ -64,21 +60,15 @@ class BroadcastPeerCommandsPlugin(CommandsPlugin):
             )
 
     async def _tab_complete(self: BroadcastPeerPlugin, text: str):
-        precommand = None
         suggestions: list[str] = []
 
         # generate autocomplete suggestions
-        if text.startswith("//"):
-            precommand = text.split()[0].removeprefix("//").casefold()
-            prefix = "//"
-        elif text.startswith("/"):
-            precommand = text.split()[0].removeprefix("/").casefold()
-            prefix = "/"
-        else:
-            prefix = ""
+        n_slashes = 2 if text.startswith("//") else 1 if text.startswith("/") else 0
+        prefix = text[:n_slashes]
 
-        if precommand is not None:
+        if n_slashes:
             parts = text.split()
+            precommand = CommandRegistry.normalize(parts[0][n_slashes:])
 
             if " " in text:
                 # User has typed at least the command name and started typing args
@@ -101,24 +91,17 @@ class BroadcastPeerCommandsPlugin(CommandsPlugin):
                         suggestions = []
             else:
                 # Still typing command name
-                all_commands = self.command_registry.all_commands()
-                suggestions = [
-                    f"{prefix}{cmd}"
-                    for cmd in all_commands.keys()
-                    if cmd.startswith(precommand.lower())
-                ]
-
-        self.downstream.send_packet(
-            0x3A,
-            VarInt.pack(len(suggestions)),
-            *(String.pack(s) for s in suggestions),
-        )
-
-    @subscribe("chat:client:.*")
+                # precommand is already casefolded
+                names = self.command_registry.names_with_prefix(precommand)
+                suggestions = list(map(prefix.__add__, names))
+
+        self.downstream.send_packet(0x3A, self._pack_suggestions(suggestions))
+
+    @subscribe("chat:client:(.*)")
     async def _broadcast_peer_base_event_chat_client_any(
-        self: BroadcastPeerPlugin, _match, buff: Buffer
+        self: BroadcastPeerPlugin, match: re.Match, _buff: Buffer
     ):
-        msg = buff.unpack(String)
+        msg = match.group(1)
         if msg.startswith("/"):
             return  # command plugin
 
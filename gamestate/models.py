@@ -133,6 +133,9 @@ class PlayerInfo:
     gamemode: int = 0
     ping: int = 0
     display_name: TextComponent | None = None
+    # cached Player List Item (0x38) ADD_PLAYER body sent to broadcast spectators;
+    # reset to None whenever the entry is updated
+    add_packet: bytes | None = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -161,6 +161,9 @@ class GameState:
         # Scoreboard
         self.objectives: dict[str, ScoreboardObjective] = {}
         self.scores: dict[str, dict[str, Score]] = {}
+        # casefolded name -> score for the "health" objective; only a fallback
+        # for get_health_score when scores["health"] has no exact match
+        self.health_scores: dict[str, Score] = {}
         self.display_slots: dict[int, str] = {}
         self.teams: dict[str, Team] = {}
 
@@ -206,6 +209,9 @@ class GameState:
 
         # Packet handlers
         self._handlers: dict[int, Callable[[Buffer], None]] = self._init_handlers()
+        self._sb_handlers: dict[int, Callable[[Buffer], None]] = (
+            self._init_sb_handlers()
+        )
 
     @property
     def health(self) -> float:
@@ -295,6 +301,17 @@ class GameState:
             0x49: self._handle_update_entity_nbt,
         }
 
+    def _init_sb_handlers(self) -> dict[int, Callable[[Buffer], None]]:
+        """Initialize serverbound packet handlers."""
+        return {
+            0x03: self._handle_sb_player,
+            0x04: self._handle_sb_player_position,
+            0x05: self._handle_sb_player_look,
+            0x06: self._handle_sb_player_position_and_look,
+            0x09: self._handle_sb_held_item_change,
+            0x0B: self._handle_sb_entity_action,
+        }
+
     def update_clientbound(self, packet_id: int, packet_data: bytes) -> None:
         """
         Update the game state based on a received packet.
@@ -1253,19 +1270,22 @@ class GameState:
 
             elif action == PlayerListAction.UPDATE_GAMEMODE:
                 gamemode = buff.unpack(VarInt)
-                if uuid in self.player_list:
-                    self.player_list[uuid].gamemode = gamemode
+                if info := self.player_list.get(uuid):
+                    info.gamemode = gamemode
+                    info.add_packet = None
 
             elif action == PlayerListAction.UPDATE_LATENCY:
                 ping = buff.unpack(VarInt)
-                if uuid in self.player_list:
-                    self.player_list[uuid].ping = ping
+                if info := self.player_list.get(uuid):
+                    info.ping = ping
+                    info.add_packet = None
 
             elif action == PlayerListAction.UPDATE_DISPLAY_NAME:
                 has_display_name = buff.unpack(Boolean)
                 display_name = Chat.unpack_component(buff) if has_display_name else None
-                if uuid in self.player_list:
-                    self.player_list[uuid].display_name = display_name or None
+                if info := self.player_list.get(uuid):
+                    info.display_name = display_name or None
+                    info.add_packet = None
 
             elif action == PlayerListAction.REMOVE_PLAYER:
                 if uuid in self.player_list:
@@ -1295,6 +1315,8 @@ class GameState:
                 del self.objectives[objective_name]
             if objective_name in self.scores:
                 del self.scores[objective_name]
+            if objective_name == "health":
+                self.health_scores.clear()
         else:
             display_text = buff.unpack(String)
             objective_type = buff.unpack(String)
@@ -1315,15 +1337,27 @@ class GameState:
             if objective_name in self.scores:
                 if score_name in self.scores[objective_name]:
                     del self.scores[objective_name][score_name]
+            if objective_name == "health":
+                key = score_name.casefold()
+                score = self.health_scores.get(key)
+                if score is not None and score.score_name == score_name:
+                    del self.health_scores[key]
+                    # another name may still differ from this one only by case
+                    for other in self.scores.get("health", {}).values():
+                        if other.score_name.casefold() == key:
+                            self.health_scores[key] = other
+                            break
         else:
             value = buff.unpack(VarInt)
             if objective_name not in self.scores:
                 self.scores[objective_name] = {}
-            self.scores[objective_name][score_name] = Score(
+            score = self.scores[objective_name][score_name] = Score(
                 score_name=score_name,
                 objective_name=objective_name,
                 value=value,
             )
+            if objective_name == "health":
+                self.health_scores[score_name.casefold()] = score
 
     def _handle_display_scoreboard(self, buff: Buffer) -> None:
         """Handle Display Scoreboard packet (0x3D)."""
@@ -1360,8 +1394,7 @@ class GameState:
             )
 
         elif mode == TeamMode.REMOVE:
-            if team_name in self.teams:
-                del self.teams[team_name]
+            self.teams.pop(team_name, None)
 
         elif mode == TeamMode.UPDATE_INFO:
             display_name = buff.unpack(String)
@@ -1371,8 +1404,7 @@ class GameState:
             name_tag_visibility = buff.unpack(String)
             color = buff.unpack(Byte)
 
-            if team_name in self.teams:
-                team = self.teams[team_name]
+            if (team := self.teams.get(team_name)) is not None:
                 team.display_name = display_name
                 team.prefix = prefix
                 team.suffix = suffix
@@ -1381,23 +1413,14 @@ class GameState:
                 team.color = color
 
         elif mode == TeamMode.ADD_PLAYERS:
-            player_count = buff.unpack(VarInt)
-            if team_name in self.teams:
-                for _ in range(player_count):
-                    self.teams[team_name].members.add(buff.unpack(String))
-            else:
-                for _ in range(player_count):
-                    _ = buff.unpack(String)
+            players = [buff.unpack(String) for _ in range(buff.unpack(VarInt))]
+            if (team := self.teams.get(team_name)) is not None:
+                team.members.update(players)
 
         elif mode == TeamMode.REMOVE_PLAYERS:
-            player_count = buff.unpack(VarInt)
-            if team_name in self.teams:
-                for _ in range(player_count):
-                    player = buff.unpack(String)
-                    self.teams[team_name].members.discard(player)
-            else:
-                for _ in range(player_count):
-                    _ = buff.unpack(String)
+            players = [buff.unpack(String) for _ in range(buff.unpack(VarInt))]
+            if (team := self.teams.get(team_name)) is not None:
+                team.members.difference_update(players)
 
     def _handle_plugin_message(self, buff: Buffer) -> None:
         """Handle Plugin Message packet (0x3F)."""
@@ -1562,46 +1585,54 @@ class GameState:
             packet_id: The serverbound packet ID
             packet_data: The raw packet data (excluding packet ID)
         """
-        buff = Buffer(packet_data)
-
-        if packet_id == 0x03:  # Player (on ground only)
-            self.on_ground = buff.unpack(Boolean)
-
-        elif packet_id == 0x04:  # Player Position
-            self.position.x = buff.unpack(Double)
-            self.position.y = buff.unpack(Double)
-            self.position.z = buff.unpack(Double)
-            self.on_ground = buff.unpack(Boolean)
-
-        elif packet_id == 0x05:  # Player Look
-            self.rotation.yaw = buff.unpack(Float)
-            self.rotation.pitch = buff.unpack(Float)
-            self.on_ground = buff.unpack(Boolean)
-
-        elif packet_id == 0x06:  # Player Position And Look
-            self.position.x = buff.unpack(Double)
-            self.position.y = buff.unpack(Double)
-            self.position.z = buff.unpack(Double)
-            self.rotation.yaw = buff.unpack(Float)
-            self.rotation.pitch = buff.unpack(Float)
-            self.on_ground = buff.unpack(Boolean)
-
-        elif packet_id == 0x09:  # Held Item Change (serverbound)
-            self.held_item_slot = buff.unpack(Short)
-
-        elif packet_id == 0x0B:  # Entity Action
-            _ = buff.unpack(VarInt)  # entity id (always player's own)
-            action_id = buff.unpack(VarInt)
-            # action_param = buff.unpack(VarInt)  # jump boost for horse, unused here
-
-            if action_id == 0:  # Start sneaking
-                self.player_flags |= EntityFlags.CROUCHED
-            elif action_id == 1:  # Stop sneaking
-                self.player_flags &= ~EntityFlags.CROUCHED
-            elif action_id == 3:  # Start sprinting
-                self.player_flags |= EntityFlags.SPRINTING
-            elif action_id == 4:  # Stop sprinting
-                self.player_flags &= ~EntityFlags.SPRINTING
+        handler = self._sb_handlers.get(packet_id)
+        if handler is not None:
+            handler(Buffer(packet_data))
+
+    def _handle_sb_player(self, buff: Buffer) -> None:
+        """Handle Player packet (0x03, on ground only)."""
+        self.on_ground = buff.unpack(Boolean)
+
+    def _handle_sb_player_position(self, buff: Buffer) -> None:
+        """Handle Player Position packet (0x04)."""
+        self.position.x = buff.unpack(Double)
+        self.position.y = buff.unpack(Double)
+        self.position.z = buff.unpack(Double)
+        self.on_ground = buff.unpack(Boolean)
+
+    def _handle_sb_player_look(self, buff: Buffer) -> None:
+        """Handle Player Look packet (0x05)."""
+        self.rotation.yaw = buff.unpack(Float)
+        self.rotation.pitch = buff.unpack(Float)
+        self.on_ground = buff.unpack(Boolean)
+
+    def _handle_sb_player_position_and_look(self, buff: Buffer) -> None:
+        """Handle Player Position And Look packet (0x06)."""
+        self.position.x = buff.unpack(Double)
+        self.position.y = buff.unpack(Double)
+        self.position.z = buff.unpack(Double)
+        self.rotation.yaw = buff.unpack(Float)
+        self.rotation.pitch = buff.unpack(Float)
+        self.on_ground = buff.unpack(Boolean)
+
+    def _handle_sb_held_item_change(self, buff: Buffer) -> None:
+        """Handle serverbound Held Item Change packet (0x09)."""
+        self.held_item_slot = buff.unpack(Short)
+
+    def _handle_sb_entity_action(self, buff: Buffer) -> None:
+        """Handle Entity Action packet (0x0B)."""
+        _ = buff.unpack(VarInt)  # entity id (always player's own)
+        action_id = buff.unpack(VarInt)
+        # action_param = buff.unpack(VarInt)  # jump boost for horse, unused here
+
+        if action_id == 0:  # Start sneaking
+            self.player_flags |= EntityFlags.CROUCHED
+        elif action_id == 1:  # Stop sneaking
+            self.player_flags &= ~EntityFlags.CROUCHED
+        elif action_id == 3:  # Start sprinting
+            self.player_flags |= EntityFlags.SPRINTING
+        elif action_id == 4:  # Stop sprinting
+            self.player_flags &= ~EntityFlags.SPRINTING
 
     # =========================================================================
     # Query Methods
@@ -1704,6 +1735,12 @@ class GameState:
             return self.scores[objective][name].value
         return None
 
+    def get_health_score(self, name: str) -> Score | None:
+        """Get a name's "health" score, falling back to a case-insensitive match."""
+        if (score := self.scores.get("health", {}).get(name)) is not None:
+            return score
+        return self.health_scores.get(name.casefold())
+
     def get_team_for_player(self, player_name: str) -> Team | None:
         """Get the team a player belongs to."""
         for team in self.teams.values():
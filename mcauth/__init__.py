@@ -25,7 +25,7 @@ Usage:
 import time
 import uuid as uuid_mod
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import jwt
 import keyring
@@ -54,6 +54,7 @@ __all__ = [
     # Storage
     "user_exists",
     "token_needs_refresh",
+    "auth_status",
     "safe_set",
     "safe_get",
     # Errors
@@ -371,6 +372,23 @@ def token_needs_refresh(username: str) -> bool:
     if record is None:
         return False
 
+    return _record_needs_refresh(record)
+
+
+def auth_status(username: str) -> Literal["missing", "needs_refresh", "ok"]:
+    """
+    Check a user's stored credentials with a single read of their file.
+
+    Equivalent to user_exists() followed by token_needs_refresh().
+    """
+    record = safe_get("proxhy", username)
+    if record is None:
+        return "missing"
+
+    return "needs_refresh" if _record_needs_refresh(record) else "ok"
+
+
+def _record_needs_refresh(record: str) -> bool:
     parts = record.split(" ")
     if len(parts) != 3:
         return True
@@ -418,7 +436,7 @@ async def load_auth_info(
 
     access_token, refresh_token, uuid = parts
 
-    if token_needs_refresh(username) and refresh_if_expired:
+    if refresh_if_expired and _record_needs_refresh(record):
         access_token, refresh_token = await _refresh_and_update_tokens(
             username, refresh_token, uuid
         )
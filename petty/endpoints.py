@@ -36,7 +36,9 @@ class PacketNode(ABC):
         StreamDirection,
         dict[tuple[int, State], PacketListenerList[Buffer]],
     ] = {"downstream": defaultdict(list), "upstream": defaultdict(list)}
-    _event_listeners: dict[str, list[EventListenerFunction]] = defaultdict(list)
+    _event_listeners: dict[re.Pattern[str], list[EventListenerFunction]] = defaultdict(
+        list
+    )
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -62,7 +64,8 @@ class PacketNode(ABC):
                     (func, meta)
                 )
             else:
-                cls._event_listeners[meta].append(func)
+                # compiled once here so emit() doesn't go through re's cache
+                cls._event_listeners[re.compile(meta)].append(func)
 
     def _setup_node(self):
         self.state = State.HANDSHAKING
@@ -149,9 +152,9 @@ class PacketNode(ABC):
 
     async def emit(self, event: str, data: Any = None):
         results = []
-        for e in self._event_listeners:
-            if (match := re.fullmatch(e, event)) is not None:
-                for handler in self._event_listeners[e]:
+        for pattern, listeners in self._event_listeners.items():
+            if (match := pattern.fullmatch(event)) is not None:
+                for handler in listeners:
                     results.append(await handler(self, match, deepcopy(data)))
         return results
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from hashlib import sha1
 
 from cryptography.hazmat.backends import default_backend
@@ -10,13 +11,25 @@ from cryptography.hazmat.primitives.serialization import (
 )
 
 
+# the same key is used for the secret and the verify token (and a server's
+# own keypair for every login), so only parse the DER once
+@lru_cache(maxsize=16)
+def _load_public_key(der_public_key: bytes):
+    return load_der_public_key(der_public_key)
+
+
+@lru_cache(maxsize=16)
+def _load_private_key(der_private_key: bytes):
+    return load_der_private_key(der_private_key, password=None)
+
+
 def pkcs1_v15_padded_rsa_encrypt(der_public_key, decrypted):
-    public_key = load_der_public_key(der_public_key)
+    public_key = _load_public_key(der_public_key)
     return public_key.encrypt(decrypted, PKCS1v15())  # type:ignore
 
 
 def pkcs1_v15_padded_rsa_decrypt(der_private_key, encrypted):
-    private_key = load_der_private_key(der_private_key, password=None)
+    private_key = _load_private_key(der_private_key)
     return private_key.decrypt(encrypted, PKCS1v15())  # type:ignore
 
 
@@ -24,12 +37,9 @@ def pkcs1_v15_padded_rsa_decrypt(der_private_key, encrypted):
 def generate_verification_hash(
     server_id: bytes, shared_secret: bytes, public_key: bytes
 ) -> str:
-    verification_hash = sha1()
-    verification_hash.update(server_id)
-    verification_hash.update(shared_secret)
-    verification_hash.update(public_key)
+    digest = sha1(b"".join((server_id, shared_secret, public_key))).digest()
 
-    number = int.from_bytes(verification_hash.digest(), byteorder="big", signed=True)
+    number = int.from_bytes(digest, byteorder="big", signed=True)
     return format(number, "x")
 
 
@@ -2,6 +2,7 @@ import re
 import struct
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from io import BytesIO
 from typing import Any, Protocol
 
@@ -23,6 +24,9 @@ class Buffer(BytesIO):
         return Buffer(self.getvalue())
 
 
+_SINGLE_BYTES = tuple(bytes((i,)) for i in range(0x80))
+
+
 class DataType[PT, UT](ABC):  # UT: unpack type, PT: pack type
     value: PT | UT
 
@@ -47,17 +51,19 @@ class VarInt(DataType[int, int]):
     # https://gist.github.com/nickelpro/7312782
     @staticmethod
     def pack(value: int) -> bytes:
-        total = b""
+        # lengths, counts and ids are almost always a single byte
+        if 0 <= value < 0x80:
+            return _SINGLE_BYTES[value]
+
+        total = bytearray()
         val = (1 << 32) + value if value < 0 else value
 
         while val >= 0x80:
-            bits = val & 0x7F
+            total.append(0x80 | (val & 0x7F))
             val >>= 7
-            total += struct.pack("B", (0x80 | bits))
 
-        bits = val & 0x7F
-        total += struct.pack("B", bits)
-        return total
+        total.append(val & 0x7F)
+        return bytes(total)
 
     @staticmethod
     def unpack(buff) -> int:
@@ -209,6 +215,16 @@ class String(DataType[str | TextComponent, str]):
         bvalue = str(value).encode("utf-8")
         return VarInt.pack(len(bvalue)) + bvalue
 
+    @staticmethod
+    def pack_many(values: Iterable[str | TextComponent]) -> bytes:
+        """Pack several strings back to back into a single bytes object"""
+        parts: list[bytes] = []
+        for value in values:
+            bvalue = str(value).encode("utf-8")
+            parts.append(VarInt.pack(len(bvalue)))
+            parts.append(bvalue)
+        return b"".join(parts)
+
     @staticmethod
     def unpack(buff) -> str:
         length = VarInt.unpack(buff)
@@ -3,6 +3,7 @@
 import abc
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass
 from io import BytesIO
 from typing import Any, Literal, Protocol, TypedDict, overload
@@ -217,6 +218,8 @@ class String(DataType[str | TextComponent, str]):
     @staticmethod
     def pack(value: str | TextComponent) -> bytes: ...
     @staticmethod
+    def pack_many(values: Iterable[str | TextComponent]) -> bytes: ...
+    @staticmethod
     def unpack(buff) -> str: ...
 
 class UUID(DataType[uuid.UUID, uuid.UUID]):
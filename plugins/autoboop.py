@@ -2,7 +2,7 @@ import re
 from typing import TYPE_CHECKING
 
 from petty.events import subscribe
-from petty.protocol.datatypes import Buffer, Chat
+from petty.protocol.datatypes import Buffer
 from proxhy.argtypes import HypixelPlayer
 from proxhy.player_list import PlayerList, PlayerListSystem
 from proxhypixel.formatting import get_rankname
@@ -22,18 +22,13 @@ class AutoboopPlugin:
             display=lambda player: get_rankname(player._player),
         ).register(self)
 
-    @subscribe(r"chat:server:(Guild|Friend) > ([A-Za-z0-9_]+) joined.$")
+    # the event pattern is full-matched against the plain chat text, so it
+    # already only fires for join lines and captures the player name
+    @subscribe(r"chat:server:(Guild|Friend) > ([A-Za-z0-9_]+) joined\.")
     async def _autoboop_event_chat_server_guild_join(
-        self: ProxhyPlugin, _match, buff: Buffer
+        self: ProxhyPlugin, match: re.Match, buff: Buffer
     ):
-        player = re.match(
-            r"^(Guild|Friend) > ([A-Za-z0-9_]+) joined\.$", buff.unpack(Chat)
-        )
-
-        if not player or not player.group(2):
-            return
-
-        player_name = str(player.group(2))
+        player_name = match.group(2)
 
         if PlayerList(f"autoboop:{self.uuid}").contains(player_name):
             self.upstream.chat(f"/boop {player_name}")
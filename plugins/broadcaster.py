@@ -29,7 +29,6 @@ from petty.protocol.datatypes import (
     Int,
     Short,
     Slot,
-    String,
     TextComponent,
     VarInt,
 )
@@ -1129,32 +1128,35 @@ class BroadcastPlugin:
         """Ensure the player being watched is in the spectator's tab list."""
         # Normalize UUID to hyphenated format to match gamestate storage
         try:
-            normalized_uuid = str(uuid_mod.UUID(self._transformer.player_uuid))
+            uuid_obj = uuid_mod.UUID(self._transformer.player_uuid)
         except ValueError:
+            uuid_obj = None
             normalized_uuid = self._transformer.player_uuid
+        else:
+            normalized_uuid = str(uuid_obj)
 
         player_info = self.gamestate.player_list.get(normalized_uuid)
 
-        try:
-            normalized_uuid_obj = uuid_mod.UUID(self._transformer.player_uuid)
+        if uuid_obj is not None:
             client.downstream.send_packet(
                 0x38,
                 VarInt.pack(4),  # action: remove player
                 VarInt.pack(1),
-                UUID.pack(normalized_uuid_obj),
+                UUID.pack(uuid_obj),
             )
-        except ValueError:
-            pass
 
         if player_info:
-            data = build_player_list_add_packet(
-                player_uuid=self._transformer.player_uuid,
-                player_name=player_info.name,
-                properties=player_info.properties,
-                gamemode=0,  # force survival so the client renders the Spawn Player
-                ping=player_info.ping,
-                display_name=player_info.display_name,
-            )
+            # cached on the entry; gamestate clears it when the entry changes
+            if player_info.add_packet is None:
+                player_info.add_packet = build_player_list_add_packet(
+                    player_uuid=self._transformer.player_uuid,
+                    player_name=player_info.name,
+                    properties=player_info.properties,
+                    gamemode=0,  # force survival so the client renders the Spawn Player
+                    ping=player_info.ping,
+                    display_name=player_info.display_name,
+                )
+            data = player_info.add_packet
         else:
             data = build_player_list_add_packet(
                 player_uuid=self._transformer.player_uuid,
@@ -1189,11 +1191,9 @@ class BroadcastPlugin:
         else:
             self.upstream.chat(f"/chat {channel}")
 
-    @subscribe("chat:client:.*")
-    async def _event_chat_client_any(
-        self: ProxhyPlugin, _match: re.Match, buff: Buffer
-    ):
-        msg = buff.unpack(String)
+    @subscribe("chat:client:(.*)")
+    async def _event_chat_client_any(self: ProxhyPlugin, match: re.Match, buff: Buffer):
+        msg = match.group(1)
         if msg.startswith("/"):
             return  # let commands plugin handle it
         elif self.broadcast_chat_toggled:
@@ -1,5 +1,6 @@
-import asyncio
 import re
+from collections import deque
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from petty.events import listen_client, listen_server, subscribe
@@ -20,6 +21,8 @@ from ._commands import (
 if TYPE_CHECKING:
     from proxhy.plugin import ProxhyPlugin
 
+_FORMAT_CODE = re.compile(r"§.")
+
 _OTHER_COMMANDS: set[str] = {
     "compass",
     "samsung_ringtone",
@@ -35,6 +38,60 @@ _OTHER_COMMANDS: set[str] = {
 }
 
 
+# the same command names and arguments are suggested on every keystroke
+@lru_cache(maxsize=1024)
+def _pack_suggestion(suggestion: str) -> bytes:
+    return String.pack(suggestion)
+
+
+def _help_line(
+    name: str, description: str, aliases: list[str], help_path: str, is_group: bool
+) -> dict:
+    """Build the component data for one /help entry as a single dict literal."""
+    extra: list[dict] = [{"text": f" /{name}", "type": "text", "color": "yellow"}]
+    if is_group:
+        extra.append({"text": " [+]", "type": "text", "color": "dark_aqua"})
+    if aliases:
+        extra.append(
+            {
+                "text": f" ({', '.join(f'/{s}' for s in aliases)})",
+                "type": "text",
+                "color": "dark_gray",
+            }
+        )
+
+    line: dict = {"text": "\n  •", "type": "text", "color": "white", "extra": extra}
+
+    if description or is_group:
+        hover: dict = {
+            "text": description,
+            "type": "text",
+            "color": "gray",
+            "italic": False,
+        }
+        if is_group:
+            prefix = "\n" if description else ""
+            hover["extra"] = [
+                {
+                    "text": f"{prefix}[+]",
+                    "type": "text",
+                    "color": "dark_aqua",
+                    "italic": False,
+                },
+                {
+                    "text": " - Contains multiple commands",
+                    "type": "text",
+                    "color": "gray",
+                    "italic": True,
+                },
+            ]
+        line["hoverEvent"] = {"action": "show_text", "value": hover}
+
+    line["clickEvent"] = {"action": "suggest_command", "value": f"/help {help_path}"}
+    line["bold"] = False
+    return line
+
+
 class CommandsPlugin:
     """
     Plugin that handles command registration, execution, and tab completion.
@@ -43,19 +100,35 @@ class CommandsPlugin:
     to have different command configurations.
     """
 
-    def _init_0_commands(self: ProxhyPlugin):  # 0 so it runs first (alphabetically)
-        self.command_registry = CommandRegistry()
-        self.suggestions: asyncio.Queue[list[str]] = asyncio.Queue()
+    # alias -> Command for every @command method on the class
+    _class_command_aliases: dict[str, Command] = {}
 
-        # Discover and register @command decorated methods
-        for item in dir(self):
-            try:
-                obj = getattr(self, item)
-                if hasattr(obj, "_command"):
-                    command: Command = obj._command
-                    self.command_registry.register(command)
-            except AttributeError:
-                pass
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # collect @command decorated methods once per class; later bases
+        # in the MRO override earlier ones by attribute name, like getattr
+        commands: dict[str, Command] = {}
+        for base in reversed(cls.__mro__):
+            for name, item in vars(base).items():
+                cmd = getattr(item, "_command", None)
+                if cmd is not None:
+                    commands[name] = cmd
+                else:
+                    commands.pop(name, None)
+
+        # built in attribute-name order, as dir() discovery used to register
+        cls._class_command_aliases = {
+            CommandRegistry.normalize(alias): cmd
+            for _, cmd in sorted(commands.items())
+            for alias in cmd.aliases
+        }
+
+    def _init_0_commands(self: ProxhyPlugin):  # 0 so it runs first (alphabetically)
+        self.command_registry = CommandRegistry(self._class_command_aliases)
+        # our suggestions waiting on the server's tab complete response;
+        # capped so lost responses can't make it grow forever (see _tab_complete)
+        self.suggestions: deque[list[str]] = deque(maxlen=8)
 
     @command("help")
     async def _command_help(self: ProxhyPlugin, *path: HelpPath):
@@ -80,17 +153,14 @@ class CommandsPlugin:
                         .append(TextComponent(cmd.name).color("gold"))
                         .append("' has no subcommands!")
                     )
-                lower = part.value.lower()
-                if lower in cmd._subgroups:
-                    cmd = cmd._subgroups[lower]
-                elif lower in cmd._subcommands:
-                    cmd = cmd._subcommands[lower]
-                else:
+                child = cmd._children.get(part.value.lower())
+                if child is None:
                     raise CommandException(
                         TextComponent("Unknown subcommand '")
                         .append(TextComponent(part.value).color("gold"))
                         .append("'!")
                     )
+                cmd = child
 
             if isinstance(cmd, CommandGroup):
                 return self._build_help_listing(cmd)
@@ -145,38 +215,8 @@ class CommandsPlugin:
             TextComponent("\nHover for info.").color("gray").bold(False).italic()
         )
 
-        for name, description, aliases, help_path, is_group in entries:
-            line = TextComponent("\n  •").color("white")
-            line.appends(TextComponent(f"/{name}").color("yellow"))
-
-            if is_group:
-                line.append(TextComponent(" [+]").color("dark_aqua"))
-
-            if aliases:
-                line.append(
-                    TextComponent(f" ({', '.join(f'/{s}' for s in aliases)})").color(
-                        "dark_gray"
-                    )
-                )
-
-            if description or is_group:
-                hover = TextComponent(description).color("gray").italic(False)
-                if is_group:
-                    prefix = "\n" if description else ""
-                    hover.append(
-                        TextComponent(f"{prefix}[+]").color("dark_aqua").italic(False)
-                    )
-                    hover.appends(
-                        TextComponent("- Contains multiple commands")
-                        .color("gray")
-                        .italic()
-                    )
-                line.hover_text(hover)
-
-            line.click_event("suggest_command", f"/help {help_path}")
-            line.bold(False)
-
-            msg.append(line)
+        for entry in entries:
+            msg.append(_help_line(*entry))
 
         if group is None and not other:
             footer = (
@@ -213,101 +253,96 @@ class CommandsPlugin:
         """
         self.command_registry.register(group)
 
-    @subscribe("chat:client:/.*")
+    # the event name already holds the decoded message, so take it
+    # from the match rather than unpacking the packet a second time
+    @subscribe("chat:client:(/.*)")
     async def _commands_event_chat_client_command(
-        self: ProxhyPlugin, _match, buff: Buffer
+        self: ProxhyPlugin, match: re.Match, _buff: Buffer
     ):
-        await self._run_command(buff.unpack(String))
+        await self._run_command(match.group(1))
 
     async def _run_command(self: ProxhyPlugin, message: str):
-        segments = message.split()
-        cmd_name = segments[0].removeprefix("/").removeprefix("/").casefold()
+        # only the command token is needed to look the command up;
+        # the arguments are split once we know it's one of ours
+        head, _, rest = message.partition(" ")
+        # strip a leading / or // in one slice
+        n_slashes = 2 if head.startswith("//") else 1 if head.startswith("/") else 0
+        cmd_name = head[n_slashes:]
 
         command: Command | CommandGroup | None = self.command_registry.get(cmd_name)
 
         if command:
             try:
-                args = segments[1:]
+                args = rest.split()
                 output: str | TextComponent = await command(self, args)
             except CommandException as err:
-                if isinstance(err.message, TextComponent):
-                    err.message.flatten()
-
-                    for i, child in enumerate(err.message.get_children()):
-                        if not child.data.get("color"):
-                            err.message.replace_child(i, child.color("dark_red"))
-                        if not child.data.get("bold"):
-                            err.message.replace_child(i, child.bold(False))
-
-                err.message = TextComponent(err.message)
-                if not err.message.data.get("color"):
-                    err.message.color("dark_red")
-
-                err.message = err.message.bold(False)
-
-                error_msg = TextComponent("∎ ").bold().color("blue").append(err.message)
-                if error_msg.data.get("clickEvent") is None:
-                    error_msg = error_msg.click_event("suggest_command", message)
-
-                self.downstream.chat(error_msg)
+                self.downstream.chat(err.to_component(message))
             else:
-                if output:
-                    if segments[0].startswith("//"):  # send output of command
-                        # remove chat formatting
-                        output = re.sub(r"§.", "", str(output))
-                        if len(output) > 256:
-                            self.downstream.chat(
-                                TextComponent(
-                                    "Can't send that to the chat, it's too long!"
-                                ).color("red")
-                            )
-                            self.downstream.chat(
-                                TextComponent("To see the output of")
-                                .color("gray")
-                                .italic()
-                                .appends(
-                                    TextComponent(cmd_s := f"/{cmd_name}")
-                                    .color("aqua")
-                                    .hover_text(cmd_s)
-                                    .click_event("suggest_command", cmd_s)
-                                )
-                                .append(", re-run it with a single slash.")
+                if not output:
+                    return
+
+                if n_slashes == 2:  # send output of command
+                    # remove chat formatting; str() of a TextComponent is already plain
+                    if isinstance(output, str):
+                        output = _FORMAT_CODE.sub("", output)
+                    else:
+                        output = str(output)
+                    if len(output) > 256:
+                        self.downstream.chat(
+                            TextComponent(
+                                "Can't send that to the chat, it's too long!"
+                            ).color("red")
+                        )
+                        self.downstream.chat(
+                            TextComponent("To see the output of")
+                            .color("gray")
+                            .italic()
+                            .appends(
+                                TextComponent(cmd_s := f"/{cmd_name}")
+                                .color("aqua")
+                                .hover_text(cmd_s)
+                                .click_event("suggest_command", cmd_s)
                             )
-                            return
-                        if self.broadcast_chat_toggled:
-                            self.bc_chat(self.username, output)
-                        else:
-                            self.upstream.chat(output)
+                            .append(", re-run it with a single slash.")
+                        )
+                    elif self.broadcast_chat_toggled:
+                        self.bc_chat(self.username, output)
                     else:
-                        if isinstance(output, TextComponent):
-                            if output.data.get("clickEvent") is None:
-                                output = output.click_event("suggest_command", message)
+                        self.upstream.chat(output)
+                    return
+
+                if (
+                    isinstance(output, TextComponent)
+                    and output.data.get("clickEvent") is None
+                ):
+                    output = output.click_event("suggest_command", message)
 
-                        self.downstream.chat(output)
+                self.downstream.chat(output)
         else:
             self.upstream.send_packet(0x01, String.pack(message))
 
+    @staticmethod
+    def _pack_suggestions(suggestions: list[str]) -> bytes:
+        """Pack a Tab-Complete (0x3A) body: the count, then every suggestion."""
+        return b"".join(
+            [VarInt.pack(len(suggestions)), *map(_pack_suggestion, suggestions)]
+        )
+
     @listen_client(0x14)
     async def packet_tab_complete(self: ProxhyPlugin, buff: Buffer):
         await self._tab_complete(buff.unpack(String))
 
     async def _tab_complete(self: ProxhyPlugin, text: str):
-        precommand = None
         forward = True
         suggestions: list[str] = []
 
         # generate autocomplete suggestions
-        if text.startswith("//"):
-            precommand = text.split()[0].removeprefix("//").casefold()
-            prefix = "//"
-        elif text.startswith("/"):
-            precommand = text.split()[0].removeprefix("/").casefold()
-            prefix = "/"
-        else:
-            prefix = ""
+        n_slashes = 2 if text.startswith("//") else 1 if text.startswith("/") else 0
+        prefix = text[:n_slashes]
 
-        if precommand is not None:
+        if n_slashes:
             parts = text.split()
+            precommand = CommandRegistry.normalize(parts[0][n_slashes:])
 
             if " " in text:
                 # User has typed at least the command name and started typing args
@@ -331,39 +366,40 @@ class CommandsPlugin:
                         suggestions = []
             else:
                 # Still typing command name
-                all_commands = self.command_registry.all_commands()
-                suggestions = [
-                    f"{prefix}{cmd}"
-                    for cmd in all_commands.keys()
-                    if cmd.startswith(precommand.lower())
-                ]
+                # precommand is already casefolded
+                names = self.command_registry.names_with_prefix(precommand)
+                suggestions = list(map(prefix.__add__, names))
 
         if forward:
-            self.suggestions.put_nowait(suggestions)
+            if len(self.suggestions) == self.suggestions.maxlen:
+                # responses were lost, so we can't tell which entry goes with
+                # which; start over instead of letting append drop the oldest
+                # and leaving every later response off by one
+                self.suggestions.clear()
+            self.suggestions.append(suggestions)
             self.upstream.send_packet(0x14, String.pack(text), Boolean.pack(False))
         else:
-            self.downstream.send_packet(
-                0x3A,
-                VarInt.pack(len(suggestions)),
-                *(String.pack(s) for s in suggestions),
-            )
+            self.downstream.send_packet(0x3A, self._pack_suggestions(suggestions))
 
     @listen_server(0x3A)
     async def packet_server_tab_complete(self: ProxhyPlugin, buff: Buffer):
         n_suggestions = buff.unpack(VarInt)
-        suggestions: list[str] = []
-        for _ in range(n_suggestions):
-            suggestions.append(buff.unpack(String))
 
+        suggestions: list[str] = []
         try:
-            suggestions.extend(self.suggestions.get_nowait())
-        except asyncio.QueueEmpty:
+            suggestions = self.suggestions.popleft()
+        except IndexError:
             pass  # this should not happen
             # since every case where we receive a tab complete packet
             # from the server should have a corresponding one from the client
 
+        # the server's strings are already packed, so pass them through
+        # untouched and append ours after them
         self.downstream.send_packet(
-            0x3A, VarInt.pack(len(suggestions)), *(String.pack(s) for s in suggestions)
+            0x3A,
+            VarInt.pack(n_suggestions + len(suggestions)),
+            buff.read(),
+            *map(_pack_suggestion, suggestions),
         )
 
 
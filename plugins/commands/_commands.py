@@ -1,12 +1,17 @@
 import annotationlib
+import functools
 import inspect
 import types
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
+from bisect import bisect_left, insort
+from collections.abc import Awaitable, Callable, Generator, Mapping
 from dataclasses import dataclass, field
+from functools import cache, cached_property
+from itertools import islice
 from typing import (
     Any,
     Literal,
+    NamedTuple,
     Union,
     get_args,
     get_origin,
@@ -16,6 +21,9 @@ from typing import (
 from petty.protocol.datatypes import TextComponent
 from proxhy.errors import ProxhyException
 
+# "∎ " prefix shown before command errors; copied by TextComponent() on use
+_ERROR_PREFIX = {"text": "∎ ", "type": "text", "bold": True, "color": "blue"}
+
 
 class CommandException(ProxhyException):
     """If a command has an error then stuff happens"""
@@ -23,6 +31,28 @@ class CommandException(ProxhyException):
     def __init__(self, message: str | TextComponent):
         self.message = message
 
+    def to_component(self, command: str) -> TextComponent:
+        """Format this error for chat; clicking it suggests the failed command."""
+        if isinstance(self.message, TextComponent):
+            # flatten() leaves a single level of plain child dicts,
+            # so they can be restyled in place in one pass
+            for child in self.message.flatten().data.get("extra", ()):
+                if not child.get("color"):
+                    child["color"] = "dark_red"
+                if not child.get("bold"):
+                    child["bold"] = False
+
+        message = TextComponent(self.message)
+        if not message.data.get("color"):
+            message.color("dark_red")
+        message.bold(False)
+
+        return (
+            TextComponent(_ERROR_PREFIX)
+            .append(message)
+            .click_event("suggest_command", command)
+        )
+
 
 class Lazy[T]:
     """
@@ -46,8 +76,12 @@ class Lazy[T]:
         self._value: T | None = None
         self.value = value
 
-    def __await__(self):
-        return self._resolve().__await__()
+    def __await__(self) -> Generator[Any, None, T]:
+        # once resolved, awaiting again returns the value without
+        # setting up a coroutine for _resolve
+        if self._resolved:
+            return self._value  # type: ignore
+        return (yield from self._resolve().__await__())
 
     async def _resolve(self) -> T:
         if not self._resolved:
@@ -80,10 +114,34 @@ class LazyArgs:
         self._parameters = parameters
         self._cache: dict[int, Any] = {}
         self._converted_count = min(len(raw_args), len(parameters))
+        # type -> indices of parameters whose hint could produce it
+        self._by_type: dict[type, list[int]] = {}
 
     def __len__(self) -> int:
         return self._converted_count
 
+    def indices_of(self, type_: type) -> list[int]:
+        """Get indices of parameters whose type hint can hold a type_ instance."""
+        if (indices := self._by_type.get(type_)) is not None:
+            return indices
+
+        indices = []
+        for i in range(self._converted_count):
+            param = self._parameters[i]
+            # union members are resolved once when the Parameter is built
+            hint_types: tuple[Any, ...] = (
+                param.union_types if param.union_types else (param.type_hint,)
+            )
+            if any(
+                isinstance(t, type) and issubclass(t, type_)
+                for t in hint_types
+                if t is not type(None)
+            ):
+                indices.append(i)
+
+        self._by_type[type_] = indices
+        return indices
+
     async def get(self, index: int) -> Any:
         """Get a converted argument by index, converting lazily if needed."""
         if index < 0 or index >= self._converted_count:
@@ -142,23 +200,11 @@ class CommandContext:
             The first argument matching the type, or None if not found
         """
         if isinstance(self.args, LazyArgs):
-            for i in range(len(self.args)):
-                hint = self.args._parameters[i].type_hint
-                # match exact type or any non-None union member that is a subclass
-                hint_types: tuple[Any, ...] = (
-                    _get_union_args(hint) if _is_union_type(hint) else (hint,)
-                )
-                matches = any(
-                    isinstance(t, type) and issubclass(t, type_)
-                    for t in hint_types
-                    if t is not type(None)
-                )
-                if matches:
-                    try:
-                        arg = await self.args.get(i)
-                        return arg
-                    except ValueError, CommandException:
-                        pass
+            for i in self.args.indices_of(type_):
+                try:
+                    return await self.args.get(i)
+                except ValueError, CommandException:
+                    pass
         else:
             for arg in self.args:
                 if isinstance(arg, Lazy):
@@ -170,10 +216,12 @@ class CommandContext:
         return None
 
 
+_UNION_TYPES = (Union, types.UnionType)
+
+
 def _is_union_type(type_hint: Any) -> bool:
     """Check if a type hint is a Union type (including X | Y syntax)."""
-    origin = get_origin(type_hint)
-    return origin is Union or origin is types.UnionType
+    return get_origin(type_hint) in _UNION_TYPES
 
 
 def _get_union_args(type_hint: Any) -> tuple[Any, ...]:
@@ -252,28 +300,153 @@ class CommandArg(ABC):
 # =============================================================================
 
 
+def _convert_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise CommandException(f"Could not convert '{value}' to an int!")
+
+
+def _convert_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        raise CommandException(f"Could not convert '{value}' to a float!")
+
+
+_BOOL_TRUE = frozenset(("true", "yes", "1", "on"))
+_BOOL_FALSE = frozenset(("false", "no", "0", "off"))
+
+
+def _convert_bool(value: str) -> bool:
+    # already-lowercase input skips the lower() call
+    if value in _BOOL_TRUE:
+        return True
+    elif value in _BOOL_FALSE:
+        return False
+
+    lower = value.lower()
+    if lower in _BOOL_TRUE:
+        return True
+    elif lower in _BOOL_FALSE:
+        return False
+    raise ValueError(f"Cannot convert '{value}' to bool")
+
+
+def _convert_str(value: str) -> str:
+    return value
+
+
+# synchronous converters for the basic types, looked up by type hint
+_BASIC_CONVERTERS: dict[Any, Callable[[str], Any]] = {
+    int: _convert_int,
+    float: _convert_float,
+    bool: _convert_bool,
+    str: _convert_str,
+}
+
+
+class _TypeInfo(NamedTuple):
+    """What a parameter annotation means for parsing; see _analyze_type_hint."""
+
+    type_hint: Any
+    is_lazy: bool
+    options: tuple | None
+    options_str: tuple[str, ...] | None
+    options_lower: frozenset[str] | None
+    is_union: bool
+    union_types: tuple | None
+    union_members: tuple[tuple[Any, Callable[[str], Any] | None], ...]
+    is_custom_type: bool
+    basic_converter: Callable[[str], Any] | None
+
+
+def _analyze_type_hint(type_hint: Any) -> _TypeInfo:
+    """Introspect a parameter annotation; see _type_info for the cached entry."""
+    # Check for Lazy[X] wrapper — unwrap to get the inner type
+    # Also handles Optional[Lazy[X]] (i.e. Union[Lazy[X], None])
+    is_lazy = get_origin(type_hint) is Lazy
+    if not is_lazy and _is_union_type(type_hint):
+        union_args = _get_union_args(type_hint)
+        non_none_args = [a for a in union_args if a is not type(None)]
+        if len(non_none_args) == 1 and get_origin(non_none_args[0]) is Lazy:
+            is_lazy = True
+            type_hint = non_none_args[0]
+    if is_lazy:
+        lazy_args = get_args(type_hint)
+        type_hint = lazy_args[0] if lazy_args else type_hint
+
+    # Check for Literal type (restricted options)
+    if get_origin(type_hint) is Literal:
+        options = get_args(type_hint)
+        # string forms for matching typed arguments, built once
+        options_str = tuple(map(str, options))
+        options_lower = frozenset(o.lower() for o in options_str)
+    else:
+        options = options_str = options_lower = None
+
+    # Check for Union type (e.g., ServerPlayer | float)
+    is_union = _is_union_type(type_hint)
+    union_types = _get_union_args(type_hint) if is_union else None
+    # (member, sync converter) for each non-None member, tried in order by
+    # Parameter.convert; CommandArg members have no sync converter
+    union_members = tuple(
+        (
+            t,
+            None
+            if isinstance(t, type) and issubclass(t, CommandArg)
+            else _BASIC_CONVERTERS.get(t, _convert_str),
+        )
+        for t in union_types or ()
+        if t is not type(None)
+    )
+
+    return _TypeInfo(
+        type_hint=type_hint,
+        is_lazy=is_lazy,
+        options=options,
+        options_str=options_str,
+        options_lower=options_lower,
+        is_union=is_union,
+        union_types=union_types,
+        union_members=union_members,
+        # Check if this is a custom CommandArg type
+        is_custom_type=isinstance(type_hint, type)
+        and issubclass(type_hint, CommandArg),
+        basic_converter=_BASIC_CONVERTERS.get(type_hint),
+    )
+
+
+@cache
+def _cached_type_info(type_hint: Any, _order_key: str) -> _TypeInfo:
+    return _analyze_type_hint(type_hint)
+
+
+def _type_info(type_hint: Any) -> _TypeInfo:
+    """_analyze_type_hint, cached since many parameters share one annotation."""
+    # unions and Literals compare (and hash) equal regardless of member order,
+    # but order matters here (conversion order, option order), so the repr,
+    # which keeps it, is part of the key
+    try:
+        return _cached_type_info(type_hint, repr(type_hint))
+    except TypeError:  # unhashable annotation
+        return _analyze_type_hint(type_hint)
+
+
 class Parameter:
     """Represents a command parameter with its metadata."""
 
     options: tuple | None
+    options_str: tuple[str, ...] | None
+    options_lower: frozenset[str] | None
     union_types: tuple | None
 
     def __init__(self, param: inspect.Parameter, type_hint: Any = None):
         self.name = param.name
-        self.type_hint = type_hint or param.annotation
-
-        # Check for Lazy[X] wrapper — unwrap to get the inner type
-        # Also handles Optional[Lazy[X]] (i.e. Union[Lazy[X], None])
-        self.is_lazy = get_origin(self.type_hint) is Lazy
-        if not self.is_lazy and _is_union_type(self.type_hint):
-            union_args = _get_union_args(self.type_hint)
-            non_none_args = [a for a in union_args if a is not type(None)]
-            if len(non_none_args) == 1 and get_origin(non_none_args[0]) is Lazy:
-                self.is_lazy = True
-                self.type_hint = non_none_args[0]
-        if self.is_lazy:
-            lazy_args = get_args(self.type_hint)
-            self.type_hint = lazy_args[0] if lazy_args else self.type_hint
+
+        info = _type_info(type_hint or param.annotation)
+        self.type_hint = info.type_hint
+        self.is_lazy = info.is_lazy
 
         # Check if required (no default value)
         if param.default is not inspect._empty:
@@ -290,69 +463,20 @@ class Parameter:
         else:
             self.infinite = False
 
-        # Check for Literal type (restricted options)
-        if get_origin(self.type_hint) is Literal:
-            self.options = get_args(self.type_hint)
-        else:
-            self.options = None
-
-        # Check for Union type (e.g., ServerPlayer | float)
-        if _is_union_type(self.type_hint):
-            self.is_union = True
-            self.union_types = _get_union_args(self.type_hint)
-        else:
-            self.is_union = False
-            self.union_types = None
-
-        # Check if this is a custom CommandArg type
-        self.is_custom_type = isinstance(self.type_hint, type) and issubclass(
-            self.type_hint, CommandArg
-        )
+        self.options = info.options
+        self.options_str = info.options_str
+        self.options_lower = info.options_lower
+        self.is_union = info.is_union
+        self.union_types = info.union_types
+        self.union_members = info.union_members
+        self.is_custom_type = info.is_custom_type
+        self.basic_converter = info.basic_converter
+        # basic and unknown types convert synchronously via convert_sync()
+        self.needs_await = self.is_union or self.is_custom_type
 
     def __repr__(self):
         return "Parameter: " + ", ".join([f"{k}={v}" for k, v in self.__dict__.items()])
 
-    @staticmethod
-    async def convert_value(ctx: CommandContext, value: str, type_hint: Any) -> Any:
-        """
-        Convert a string value to the specified type.
-
-        Supports:
-        - CommandArg subclasses (async convert)
-        - Basic types: int, float, str, bool
-        - Returns the string as-is for unknown types
-        """
-        # Check if it's a CommandArg subclass
-        if isinstance(type_hint, type) and issubclass(type_hint, CommandArg):
-            return await type_hint.convert(ctx, value)
-
-        if type_hint is int:
-            if not value.lstrip("-").isdigit():
-                raise CommandException(f"Could not convert '{value}' to an int!")
-        elif type_hint is float:
-            try:
-                float(value)
-            except ValueError:
-                raise CommandException(f"Could not convert '{value}' to a float!")
-
-        # Handle basic types
-        if type_hint is int:
-            return int(value)
-        elif type_hint is float:
-            return float(value)
-        elif type_hint is bool:
-            lower = value.lower()
-            if lower in ("true", "yes", "1", "on"):
-                return True
-            elif lower in ("false", "no", "0", "off"):
-                return False
-            raise ValueError(f"Cannot convert '{value}' to bool")
-        elif type_hint is str:
-            return value
-
-        # Unknown type, return as string
-        return value
-
     async def convert(self, ctx: CommandContext, value: str) -> Any:
         """
         Convert a string value to this parameter's type.
@@ -360,14 +484,13 @@ class Parameter:
         For union types, tries each type in order until one succeeds.
         """
         if self.is_union and self.union_types:
-            # Try each type in the union in order
+            # Try each type in the union in order (NoneType is already left out)
             errors = []
-            for member_type in self.union_types:
-                # Skip NoneType in unions (for Optional types)
-                if member_type is type(None):
-                    continue
+            for member_type, converter in self.union_members:
                 try:
-                    return await self.convert_value(ctx, value, member_type)
+                    if converter is None:
+                        return await member_type.convert(ctx, value)
+                    return converter(value)
                 except (ValueError, CommandException) as e:
                     errors.append((member_type, e))
                     continue
@@ -375,17 +498,13 @@ class Parameter:
             # All types failed - raise an error with details
             # If there's only one non-None type and it raised a CommandException,
             # use that error directly (it's likely more user-friendly)
-            non_none_errors = [(t, e) for t, e in errors if t is not type(None)]
-            if len(non_none_errors) == 1 and isinstance(
-                non_none_errors[0][1], CommandException
-            ):
-                raise non_none_errors[0][1]
+            if len(errors) == 1 and isinstance(errors[0][1], CommandException):
+                raise errors[0][1]
 
             # Multiple types failed - show generic message
             type_names = [
                 t.__name__ if hasattr(t, "__name__") else str(t)
-                for t in self.union_types
-                if t is not type(None)
+                for t, _ in self.union_members
             ]
             raise CommandException(
                 TextComponent("Could not parse '")
@@ -398,30 +517,33 @@ class Parameter:
             return await self.type_hint.convert(ctx, value)
 
         else:
-            return await self.convert_value(ctx, value, self.type_hint)
+            return self.convert_sync(value)
+
+    def convert_sync(self, value: str) -> Any:
+        """Convert a value without awaiting; only valid when not needs_await."""
+        if self.basic_converter is not None:
+            return self.basic_converter(value)
+        # Unknown type, return as string
+        return value
 
     async def get_suggestions(self, ctx: CommandContext, partial: str) -> list[str]:
         """Get tab completion suggestions for this parameter."""
         suggestions: list[str] = []
 
-        if self.options:
+        if self.options_str:
             # Literal type - suggest from options
+            partial_lower = partial.lower()
             suggestions = [
-                str(o)
-                for o in self.options
-                if str(o).lower().startswith(partial.lower())
+                o for o in self.options_str if o.lower().startswith(partial_lower)
             ]
         elif self.is_union and self.union_types:
             # Union type - collect suggestions from all CommandArg members
-            for member_type in self.union_types:
-                if isinstance(member_type, type) and issubclass(
-                    member_type, CommandArg
-                ):
+            for member_type, converter in self.union_members:
+                if converter is None:
                     member_suggestions = await member_type.suggest(ctx, partial)
                     suggestions.extend(member_suggestions)
             # Deduplicate while preserving order
-            seen = set()
-            suggestions = [s for s in suggestions if not (s in seen or seen.add(s))]
+            suggestions = list(dict.fromkeys(suggestions))
         elif self.is_custom_type:
             suggestions = await self.type_hint.suggest(ctx, partial)
         return suggestions
@@ -432,6 +554,35 @@ class Parameter:
 # =============================================================================
 
 
+@cache
+def _resolve_type_hints(function: Callable[..., Any]) -> dict[str, Any]:
+    """
+    Resolve a command function's type hints, once per function.
+
+    Commands defined in files with `from __future__ import annotations` AND
+    `self: ProxhyPlugin` (only available under TYPE_CHECKING) will cause
+    get_type_hints to raise a NameError because Python 3.14's __annotate__
+    runs in the function's own globals before any localns can be injected.
+    We use annotationlib.Format.FORWARDREF which evaluates what it can and
+    leaves unresolvable names as ForwardRef objects rather than crashing.
+    We then drop any ForwardRef values (which will only ever be `self`).
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    try:
+        raw = annotationlib.get_annotations(
+            function, format=annotationlib.Format.FORWARDREF
+        )
+        return {
+            k: v for k, v in raw.items() if not isinstance(v, annotationlib.ForwardRef)
+        }
+    except Exception:
+        try:
+            return get_type_hints(function)
+        except Exception:
+            return {}
+
+
 class Command:
     """
     Represents a single command (or subcommand).
@@ -452,43 +603,23 @@ class Command:
         self.description = inspect.getdoc(function)
         self.usage = usage
         self.parent: CommandGroup | None = None
+        self._usage_message: TextComponent | None = None
 
-        # Get type hints for proper annotation resolution.
-        # Commands defined in files with `from __future__ import annotations` AND
-        # `self: ProxhyPlugin` (only available under TYPE_CHECKING) will cause
-        # get_type_hints to raise a NameError because Python 3.14's __annotate__
-        # runs in the function's own globals before any localns can be injected.
-        # We use annotationlib.Format.FORWARDREF which evaluates what it can and
-        # leaves unresolvable names as ForwardRef objects rather than crashing.
-        # We then drop any ForwardRef values (which will only ever be `self`).
-        hints: dict[str, Any] = {}
-        try:
-            raw = annotationlib.get_annotations(
-                function, format=annotationlib.Format.FORWARDREF
-            )
-            hints = {
-                k: v
-                for k, v in raw.items()
-                if not isinstance(v, annotationlib.ForwardRef)
-            }
-        except Exception:
-            try:
-                hints = get_type_hints(function)
-            except Exception:
-                hints = {}
+        hints = _resolve_type_hints(function)
 
         # Parse parameters (skip 'self') using STRING format so Python 3.14 does
         # not try to eagerly evaluate annotations (which would also fail for
         # TYPE_CHECKING-only names like ProxhyPlugin).
         sig = inspect.signature(function, annotation_format=annotationlib.Format.STRING)
-        params = list(sig.parameters.values())[1:]  # Skip self
+        params = islice(sig.parameters.values(), 1, None)  # Skip self
         self.parameters = [Parameter(p, hints.get(p.name)) for p in params]
         self.required_parameters = [p for p in self.parameters if p.required]
+        self.has_infinite = any(p.infinite for p in self.parameters)
         self.restricted_parameters = [
             (i, p) for i, p in enumerate(self.parameters) if p.options
         ]
 
-    @property
+    @cached_property
     def full_name(self) -> str:
         """Get the full command path (e.g., 'broadcast trust add')."""
         if self.parent:
@@ -496,6 +627,12 @@ class Command:
         return self.name
 
     def _build_usage_message(self) -> TextComponent:
+        # built once; hand out a copy so callers can restyle the top level
+        if self._usage_message is None:
+            self._usage_message = self._compute_usage_message()
+        return TextComponent(self._usage_message)
+
+    def _compute_usage_message(self) -> TextComponent:
         msg = TextComponent("Usage: ").color("yellow")
 
         if self.usage:
@@ -574,8 +711,7 @@ class Command:
         if not self.parameters and args:
             raise CommandException(self._build_usage_message())
 
-        has_infinite = any(p.infinite for p in self.parameters)
-        if len(args) > len(self.parameters) and not has_infinite:
+        if len(args) > len(self.parameters) and not self.has_infinite:
             raise CommandException(self._build_usage_message())
 
         if len(args) < len(self.required_parameters):
@@ -583,16 +719,16 @@ class Command:
 
         # Validate restricted parameters (Literal types)
         for index, param in self.restricted_parameters:
-            if index < len(args) and param.options:
-                if args[index].lower() not in [str(o).lower() for o in param.options]:
+            # both are set together for Literal parameters
+            options_lower, options_str = param.options_lower, param.options_str
+            if index < len(args) and options_lower and options_str:
+                if args[index].lower() not in options_lower:
                     raise CommandException(
                         TextComponent("Invalid option '")
                         .append(TextComponent(args[index]).color("gold"))
                         .append("'. Please choose a correct argument! (")
                         .append(
-                            TextComponent(
-                                ", ".join(str(o) for o in param.options)
-                            ).color("dark_aqua")
+                            TextComponent(", ".join(options_str)).color("dark_aqua")
                         )
                         .append(")")
                     )
@@ -616,23 +752,30 @@ class Command:
                 for j, arg in enumerate(remaining):
                     ctx.param_index = i + j
                     if param.is_lazy:
-                        idx = arg_index + j
                         lazy = Lazy(
-                            lambda p=param, a=arg, ix=idx: self._lazy_convert(
-                                ctx, p, a, ix
+                            functools.partial(
+                                self._lazy_convert, ctx, param, arg, arg_index + j
                             ),
                             value=arg,
                         )
                         converted_args.append(lazy)
                     else:
-                        converted = await param.convert(ctx, arg)
+                        converted = (
+                            await param.convert(ctx, arg)
+                            if param.needs_await
+                            else param.convert_sync(arg)
+                        )
                         converted_args.append(converted)
                 break
             elif arg_index < len(args):
                 if not param.required and not param.is_lazy:
                     # Optional non-lazy: try conversion; fall through on failure
                     try:
-                        converted = await param.convert(ctx, args[arg_index])
+                        converted = (
+                            await param.convert(ctx, args[arg_index])
+                            if param.needs_await
+                            else param.convert_sync(args[arg_index])
+                        )
                         converted_args.append(converted)
                         arg_index += 1
                     except ValueError, CommandException:
@@ -642,14 +785,22 @@ class Command:
                     # Required or lazy: always consume the arg
                     if param.is_lazy:
                         lazy = Lazy(
-                            lambda p=param, a=args[arg_index], ix=arg_index: (
-                                self._lazy_convert(ctx, p, a, ix)
+                            functools.partial(
+                                self._lazy_convert,
+                                ctx,
+                                param,
+                                args[arg_index],
+                                arg_index,
                             ),
                             value=args[arg_index],
                         )
                         converted_args.append(lazy)
                     else:
-                        converted = await param.convert(ctx, args[arg_index])
+                        converted = (
+                            await param.convert(ctx, args[arg_index])
+                            if param.needs_await
+                            else param.convert_sync(args[arg_index])
+                        )
                         converted_args.append(converted)
                     arg_index += 1
 
@@ -683,7 +834,10 @@ class Command:
                 return param_index
             if not param.required and not param.is_lazy:
                 try:
-                    await param.convert(ctx, args[arg_index])
+                    if param.needs_await:
+                        await param.convert(ctx, args[arg_index])
+                    else:
+                        param.convert_sync(args[arg_index])
                     arg_index += 1
                 except ValueError, CommandException:
                     pass  # fallthrough: don't advance
@@ -787,6 +941,11 @@ class CommandGroup:
         self._base_command: Command | None = None
         self._subcommands: dict[str, Command] = {}
         self._subgroups: dict[str, CommandGroup] = {}
+        # every subcommand and subgroup under all of its names;
+        # subgroups win on a name clash, matching __call__
+        self._children: dict[str, Command | CommandGroup] = {}
+        # rebuilt after subcommands or subgroups are added
+        self._usage_message: TextComponent | None = None
 
     @property
     def description(self) -> str | None:
@@ -794,7 +953,7 @@ class CommandGroup:
             self._base_command.description if self._base_command else None
         )
 
-    @property
+    @cached_property
     def full_name(self) -> str:
         """Get the full command path (e.g., 'broadcast setting')."""
         if self.parent:
@@ -853,15 +1012,19 @@ class CommandGroup:
 
         def decorator(func: Callable[..., Awaitable[Any]]):
             cmd = Command(func, name=name or self.name, aliases=aliases, usage=usage)
+            # set before anything reads (and caches) cmd.full_name
             cmd.parent = self
 
             if name is None:
                 self._base_command = cmd
             else:
                 # Register under primary name and all aliases
-                self._subcommands[name.lower()] = cmd
-                for alias in aliases:
-                    self._subcommands[alias.lower()] = cmd
+                keys = dict.fromkeys((k.lower() for k in (name, *aliases)), cmd)
+                self._subcommands.update(keys)
+                self._children.update(
+                    {k: cmd for k in keys if k not in self._subgroups}
+                )
+            self._usage_message = None
 
             return func
 
@@ -882,24 +1045,29 @@ class CommandGroup:
         subgroup = CommandGroup(name, *aliases, help=help, parent=self)
 
         # Register under primary name and all aliases
-        self._subgroups[name.lower()] = subgroup
-        for alias in aliases:
-            self._subgroups[alias.lower()] = subgroup
+        keys = dict.fromkeys((k.lower() for k in (name, *aliases)), subgroup)
+        self._subgroups.update(keys)
+        self._children.update(keys)
+        self._usage_message = None
 
         return subgroup
 
     def _build_usage_message(self) -> TextComponent:
+        # built once; hand out a copy so callers can restyle the top level
+        if self._usage_message is None:
+            self._usage_message = self._compute_usage_message()
+        return TextComponent(self._usage_message)
+
+    def _compute_usage_message(self) -> TextComponent:
         """Build a usage message showing available subcommands."""
         msg = TextComponent("Usage: ").color("yellow")
         msg.append(TextComponent(f"/{self.full_name} ").color("gold"))
         msg.append(TextComponent("<").color("gray"))
 
         # Collect unique subcommand names (not aliases)
-        subcommand_names = set()
-        for cmd in self._subcommands.values():
-            subcommand_names.add(cmd.name)
-        for grp in self._subgroups.values():
-            subcommand_names.add(grp.name)
+        subcommand_names = {cmd.name for cmd in self._subcommands.values()} | {
+            grp.name for grp in self._subgroups.values()
+        }
 
         options = sorted(subcommand_names)
         msg.append(TextComponent("|".join(options)).color("white"))
@@ -924,16 +1092,9 @@ class CommandGroup:
             else:
                 return self._build_usage_message()
 
-        subcommand_name = args[0].lower()
-        remaining_args = args[1:]
-
-        # Check for subgroup first
-        if subcommand_name in self._subgroups:
-            return await self._subgroups[subcommand_name](proxy, remaining_args)
-
-        # Check for subcommand
-        if subcommand_name in self._subcommands:
-            return await self._subcommands[subcommand_name](proxy, remaining_args)
+        # _children already prefers subgroups over subcommands
+        if (child := self._children.get(args[0].lower())) is not None:
+            return await child(proxy, args[1:])
 
         # Unknown subcommand
         raise CommandException(
@@ -949,30 +1110,17 @@ class CommandGroup:
         """Get tab completion suggestions."""
         if not args:
             # Suggest subcommands and subgroups
-            all_options = list(self._subcommands.keys()) + list(self._subgroups.keys())
-            # Filter to unique names (not aliases) that match partial
-            seen = set()
-            suggestions = []
-            for opt in all_options:
-                if opt.lower().startswith(partial.lower()) and opt not in seen:
-                    seen.add(opt)
-                    suggestions.append(opt)
-            return suggestions
-
-        subcommand_name = args[0].lower()
-        remaining_args = args[1:]
-
-        # Delegate to subgroup
-        if subcommand_name in self._subgroups:
-            return await self._subgroups[subcommand_name].get_suggestions(
-                proxy, remaining_args, partial
-            )
+            # Filter to unique names that match partial; keys are already lowercase
+            partial_lower = partial.lower()
+            return [
+                opt
+                for opt in dict.fromkeys((*self._subcommands, *self._subgroups))
+                if opt.startswith(partial_lower)
+            ]
 
-        # Delegate to subcommand
-        if subcommand_name in self._subcommands:
-            return await self._subcommands[subcommand_name].get_suggestions(
-                proxy, remaining_args, partial
-            )
+        # Delegate to subgroup or subcommand
+        if (child := self._children.get(args[0].lower())) is not None:
+            return await child.get_suggestions(proxy, args[1:], partial)
 
         return []
 
@@ -990,31 +1138,47 @@ class CommandRegistry:
     to have different command sets or configurations.
     """
 
-    def __init__(self):
-        self._commands: dict[str, Command | CommandGroup] = {}
+    def __init__(self, commands: Mapping[str, Command | CommandGroup] | None = None):
+        # copied so instances can register extra commands independently
+        self._commands: dict[str, Command | CommandGroup] = dict(commands or {})
+        # sorted keys of _commands, for prefix lookups during tab completion
+        self._sorted_names: list[str] = sorted(self._commands)
+        # live read-only view handed out by all_commands()
+        self._commands_view = types.MappingProxyType(self._commands)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Casefold a command name; ASCII lowercase names are returned as is."""
+        if name.isascii() and name.islower():
+            return name
+        return name.casefold()
 
     def register(self, cmd: Command | CommandGroup) -> None:
         """Register a command or command group."""
-        for alias in cmd.aliases:
-            self._commands[alias.lower()] = cmd
+        aliases = dict.fromkeys(map(self.normalize, cmd.aliases), cmd)
+        for alias in aliases.keys() - self._commands.keys():
+            insort(self._sorted_names, alias)
+        self._commands.update(aliases)
 
     def get(self, name: str) -> Command | CommandGroup | None:
         """Get a command by name or alias."""
-        return self._commands.get(name.lower())
+        return self._commands.get(self.normalize(name))
+
+    def names_with_prefix(self, prefix: str) -> list[str]:
+        """Get all command names and aliases starting with prefix, sorted."""
+        names = self._sorted_names
+        start = end = bisect_left(names, prefix)
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
 
-    def all_commands(self) -> dict[str, Command | CommandGroup]:
-        """Get all registered commands."""
-        return self._commands.copy()
+    def all_commands(self) -> Mapping[str, Command | CommandGroup]:
+        """Get a read-only view of all registered commands."""
+        return self._commands_view
 
     def command_names(self) -> list[str]:
         """Get all unique command names (not aliases)."""
-        seen = set()
-        names = []
-        for cmd in self._commands.values():
-            if cmd.name not in seen:
-                seen.add(cmd.name)
-                names.append(cmd.name)
-        return names
+        return list(dict.fromkeys(cmd.name for cmd in self._commands.values()))
 
 
 # =============================================================================
@@ -1070,34 +1234,28 @@ class HelpPath(CommandArg):
         prior = ctx.raw_args[: ctx.param_index]
 
         if not prior:
+            partial_lower = partial.lower()
             return [
                 name
                 for name in registry.command_names()
-                if name.startswith(partial.lower())
+                if name.startswith(partial_lower)
             ]
 
-        root = registry.get(prior[0].lower())
+        root = registry.get(prior[0])
         if not isinstance(root, CommandGroup):
             return []
 
         group = root
         for segment in prior[1:]:
-            lower = segment.lower()
-            if lower in group._subgroups:
-                group = group._subgroups[lower]
-            else:
+            child = group._children.get(segment.lower())
+            if not isinstance(child, CommandGroup):
                 return []
-
-        options: list[str] = []
-        seen: set[int] = set()
-        for cmd in group._subcommands.values():
-            if id(cmd) not in seen:
-                seen.add(id(cmd))
-                if cmd.name.startswith(partial.lower()):
-                    options.append(cmd.name)
-        for grp in group._subgroups.values():
-            if id(grp) not in seen:
-                seen.add(id(grp))
-                if grp.name.startswith(partial.lower()):
-                    options.append(grp.name)
-        return options
+            group = child
+
+        partial = partial.lower()
+        # dict.fromkeys drops alias duplicates while keeping registration order
+        return [
+            child.name
+            for child in dict.fromkeys(group._children.values())
+            if child.name.startswith(partial)
+        ]
@@ -1,24 +1,38 @@
+from dataclasses import fields
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from petty.protocol.datatypes import TextComponent
 from plugins.commands import command
+from proxhypixel.models import Game
 
 if TYPE_CHECKING:
     from proxhy.plugin import ProxhyPlugin
 
+# fields shown by /game and /rqgame, with their labels built once;
+# labels are copied before use so appending values doesn't change them
+_GAME_KEYS = tuple(f.name for f in fields(Game))
+_get_game_values = attrgetter(*_GAME_KEYS)
+_GAME_LABELS = tuple(
+    TextComponent(f"{key.capitalize()}: ").color("aqua") for key in _GAME_KEYS
+)
+
 
 class DebugPlugin:
+    def _chat_game(self: ProxhyPlugin, title: str, game: Game):
+        self.downstream.chat(TextComponent(title).color("green"))
+        for label, value in zip(_GAME_LABELS, _get_game_values(game), strict=True):
+            if value:
+                self.downstream.chat(
+                    TextComponent(label).append(
+                        TextComponent(str(value)).color("yellow")
+                    )
+                )
+
     @command("game")
     async def _command_game(self: ProxhyPlugin):
         """Display current game info."""
-        self.downstream.chat(TextComponent("Game:").color("green"))
-        for key in type(self.game).__annotations__:
-            if value := getattr(self.game, key):
-                self.downstream.chat(
-                    TextComponent(f"{key.capitalize()}: ")
-                    .color("aqua")
-                    .append(TextComponent(str(value)).color("yellow"))
-                )
+        self._chat_game("Game:", self.game)
 
     @command("nicked")
     async def _command_nicked(self: ProxhyPlugin):
@@ -44,22 +58,16 @@ class DebugPlugin:
     @command("rqgame")
     async def _command_rqgame(self: ProxhyPlugin):
         """Display requeue game info."""
-        self.downstream.chat(TextComponent("Requeue Game:").color("green"))
-        for key in type(self.rq_game).__annotations__:
-            if value := getattr(self.rq_game, key):
-                self.downstream.chat(
-                    TextComponent(f"{key.capitalize()}: ")
-                    .color("aqua")
-                    .append(TextComponent(str(value)).color("yellow"))
-                )
+        self._chat_game("Requeue Game:", self.rq_game)
 
     @command("teams")
     async def _command_teams(self: ProxhyPlugin):
         """[DEBUG] Print out all current teams known to Proxhy."""
-        print("\n")
-        for team_name, team in self.gamestate.teams.items():
-            print(f"{team_name}: {team}")
-        print("\n")
+        # one print call rather than one per team
+        lines = "".join(
+            f"{team_name}: {team}\n" for team_name, team in self.gamestate.teams.items()
+        )
+        print(f"\n\n{lines}\n")
 
     @command("player_list")
     async def _command_player_list(self: ProxhyPlugin):
@@ -1,5 +1,8 @@
+import asyncio
 import time
-from collections.abc import Hashable
+import traceback
+from collections import deque
+from collections.abc import Hashable, KeysView
 from typing import TYPE_CHECKING
 
 from gamestate.state import Entity, GameState
@@ -13,13 +16,18 @@ if TYPE_CHECKING:
 
 
 class ExpiringSet[T: Hashable]:
+    __slots__ = ("ttl", "_data", "_expiry")
+
     def __init__(self, ttl: float):
         self.ttl = ttl
         self._data: dict[T, float] = {}
+        # (expiry, value) in add order; ttl is fixed, so expiries only increase
+        self._expiry: deque[tuple[float, T]] = deque()
 
     def add(self, value: T):
-        now = time.monotonic()
-        self._data[value] = now + self.ttl
+        expires = time.monotonic() + self.ttl
+        self._data[value] = expires
+        self._expiry.append((expires, value))
 
     def __contains__(self, value: int) -> bool:
         self._cleanup()
@@ -27,13 +35,17 @@ class ExpiringSet[T: Hashable]:
 
     def _cleanup(self):
         now = time.monotonic()
-        expired = [k for k, t in self._data.items() if t <= now]
-        for k in expired:
-            del self._data[k]
-
-    def values(self):
+        expiry, data = self._expiry, self._data
+        while expiry and expiry[0][0] <= now:
+            t, k = expiry.popleft()
+            # skip stale entries for values that were re-added since
+            if data.get(k) == t:
+                del data[k]
+
+    def values(self) -> KeysView[T]:
+        """Live view of the unexpired values; copy it before calling add()."""
         self._cleanup()
-        return set(self._data)
+        return self._data.keys()
 
     def __iter__(self):
         return iter(self._data)
@@ -46,11 +58,19 @@ class GameStatePlugin:
         self.gamestate = GameState()
         self.in_combat_with = ExpiringSet(ttl=5)
 
+        # (event, packet id, data) waiting to be emitted, in packet order;
+        # drained by one task per burst instead of one task per packet
+        self._gamestate_updates: deque[tuple[str, int, bytes]] = deque()
+        self._gamestate_drain: asyncio.Task | None = None
+
         _original_send_packet = self.downstream.send_packet
 
+        # join the payload once and hand the same bytes to the gamestate,
+        # the update event and the real send_packet
         def _hooked_cb_send_packet(packet_id: int, *data: bytes) -> None:
-            self._handle_clientbound_packet(packet_id, Buffer(b"".join(data)))
-            _original_send_packet(packet_id, *data)
+            payload = b"".join(data)
+            self._handle_clientbound_packet(packet_id, payload)
+            _original_send_packet(packet_id, payload)
 
         self.downstream.send_packet = _hooked_cb_send_packet  # type: ignore
 
@@ -59,18 +79,41 @@ class GameStatePlugin:
         _original_send_packet = self.upstream.send_packet
 
         def _hooked_sb_send_packet(packet_id: int, *data: bytes) -> None:
-            self._handle_serverbound_packet(packet_id, Buffer(b"".join(data)))
-            _original_send_packet(packet_id, *data)
+            payload = b"".join(data)
+            self._handle_serverbound_packet(packet_id, payload)
+            _original_send_packet(packet_id, payload)
 
         self.upstream.send_packet = _hooked_sb_send_packet  # type: ignore
 
-    def _handle_clientbound_packet(self: ProxhyPlugin, packet_id: int, buff: Buffer):
-        self.gamestate.update_clientbound(packet_id, buff.getvalue())
-        self.create_task(self.emit("cb_gamestate_update", (packet_id, buff.getvalue())))
-
-    def _handle_serverbound_packet(self: ProxhyPlugin, packet_id: int, buff: Buffer):
-        self.gamestate.update_serverbound(packet_id, buff.getvalue())
-        self.create_task(self.emit("sb_gamestate_update", (packet_id, buff.getvalue())))
+    def _handle_clientbound_packet(self: ProxhyPlugin, packet_id: int, data: bytes):
+        self.gamestate.update_clientbound(packet_id, data)
+        self._queue_gamestate_update("cb_gamestate_update", packet_id, data)
+
+    def _handle_serverbound_packet(self: ProxhyPlugin, packet_id: int, data: bytes):
+        self.gamestate.update_serverbound(packet_id, data)
+        self._queue_gamestate_update("sb_gamestate_update", packet_id, data)
+
+    def _queue_gamestate_update(
+        self: ProxhyPlugin, event: str, packet_id: int, data: bytes
+    ):
+        self._gamestate_updates.append((event, packet_id, data))
+        if self._gamestate_drain is None:
+            self._gamestate_drain = self.create_task(self._drain_gamestate_updates())
+
+    async def _drain_gamestate_updates(self: ProxhyPlugin):
+        emit = self.emit
+        try:
+            while self._gamestate_updates:
+                # take everything queued so far in one go; packets sent while
+                # we emit land in the fresh deque and are picked up next pass
+                batch, self._gamestate_updates = self._gamestate_updates, deque()
+                for event, packet_id, data in batch:
+                    try:
+                        await emit(event, (packet_id, data))
+                    except Exception:
+                        traceback.print_exc()
+        finally:
+            self._gamestate_drain = None
 
     @listen_client(0x02, blocking=True)
     async def _packet_use_entity(self: ProxhyPlugin, buff: Buffer):
@@ -83,8 +126,12 @@ class GameStatePlugin:
 
     @property
     def ein_combat_with(self: ProxhyPlugin) -> list[Entity]:
-        entities = [self.gamestate.get_entity(e) for e in self.in_combat_with.values()]
-        return [e for e in entities if e is not None]
+        get_entity = self.gamestate.get_entity
+        return [
+            entity
+            for eid in self.in_combat_with.values()
+            if (entity := get_entity(eid)) is not None
+        ]
 
 
 # # construct cb listeners
@@ -92,7 +139,7 @@ class GameStatePlugin:
 
 #     def _make_cb_handler(packet_id: int):
 #         async def _handler(self: ProxhyPlugin, buff: Buffer):
-#             self._handle_clientbound_packet(packet_id, buff)
+#             self._handle_clientbound_packet(packet_id, buff.getvalue())
 
 #         return _handler
 
@@ -109,7 +156,7 @@ class GameStatePlugin:
 
 #     def _make_sb_handler(packet_id: int):
 #         async def _handler(self: ProxhyPlugin, buff: Buffer):
-#             self._handle_serverbound_packet(packet_id, buff)
+#             self._handle_serverbound_packet(packet_id, buff.getvalue())
 
 #         return _handler
 
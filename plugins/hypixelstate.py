@@ -1,15 +1,19 @@
 import asyncio
+import re
 from typing import TYPE_CHECKING
 
 import orjson
 
 from petty.events import listen_client, listen_server, subscribe
-from petty.protocol.datatypes import Buffer, ByteArray, Chat, Int, String
+from petty.protocol.datatypes import Buffer, ByteArray, Int, String
 from proxhypixel.models import Game
 
 if TYPE_CHECKING:
     from proxhy.plugin import ProxhyPlugin
 
+# chat packet body for /locraw, which is sent on every join
+_LOCRAW = String.pack("/locraw")
+
 
 class HypixelStatePlugin:
     def _init_hypixelstate(self: ProxhyPlugin):
@@ -21,8 +25,9 @@ class HypixelStatePlugin:
         self.received_locraw = asyncio.Event()
         self.received_locraw.set()
 
-        self.received_who = asyncio.Event()
-        self.received_who.set()
+        # nothing waits on /who, so a flag is enough; False while our
+        # own /who is in flight so its reply isn't shown
+        self.received_who = True
 
         self.nick = None
 
@@ -36,7 +41,7 @@ class HypixelStatePlugin:
         self.received_locraw.clear()
 
         if not self.client_type == "lunar":
-            self.upstream.send_packet(0x01, String.pack("/locraw"))
+            self.upstream.send_packet(0x01, _LOCRAW)
 
     def _update_game(self: ProxhyPlugin, game: dict):
         self.game.update(game)
@@ -45,33 +50,33 @@ class HypixelStatePlugin:
         else:
             return
 
-    @subscribe(r"chat:server:\{.*\}$")
+    # locraw replies always carry a "server" key, so other {...} lines never
+    # reach the handler; the captured text is the already-decoded message
+    @subscribe(r'chat:server:(\{.*"server".*\})$')
     async def _hypixelstate_event_chat_server_locraw(
-        self: ProxhyPlugin, _match, buff: Buffer
+        self: ProxhyPlugin, match: re.Match, buff: Buffer
     ):
-        message = buff.unpack(Chat)
+        message = match.group(1)
 
         if not self.received_locraw.is_set():
             if "limbo" in message:  # sometimes returns limbo right when you join
-                if not self.gamestate.teams.values():  # probably in limbo
-                    return
-                elif self.client_type != "lunar":
+                if self.gamestate.teams and self.client_type != "lunar":
                     await asyncio.sleep(0.1)
-                    return self.upstream.send_packet(0x01, String.pack("/locraw"))
-            else:
-                self.received_locraw.set()
-                self._update_game(orjson.loads(message))
+                    self.upstream.send_packet(0x01, _LOCRAW)
+                return  # no teams: probably in limbo
+            self.received_locraw.set()
         else:
             self.downstream.send_packet(0x02, buff.getvalue())
-            self._update_game(orjson.loads(message))
+
+        self._update_game(orjson.loads(message))
 
     @listen_client(0x17)
     async def packet_plugin_channel(self: ProxhyPlugin, buff: Buffer):
         self.upstream.send_packet(0x17, buff.getvalue())
 
-        channel = buff.unpack(String)
-        data = buff.unpack(ByteArray)
-        if channel == "MC|Brand":
+        # only the brand payload is inspected, so don't copy out the others
+        if buff.unpack(String) == "MC|Brand":
+            data = buff.unpack(ByteArray)
             if b"lunarclient" in data:
                 self.client_type = "lunar"
             elif b"vanilla" in data:
@@ -79,13 +84,10 @@ class HypixelStatePlugin:
 
     def get_health(self: ProxhyPlugin, player_name: str) -> float | None:
         health = None
-
-        for name, score in (self.gamestate.scores.get("health") or {}).items():
-            if name.casefold() == player_name.casefold():
-                health = float(score.value)
-
         if player_name.casefold() == self.username.casefold():
             health = self.gamestate.health
+        elif (score := self.gamestate.get_health_score(player_name)) is not None:
+            health = float(score.value)
 
         if health is not None:
             return round(health, 1)
@@ -1,7 +1,9 @@
 import asyncio
 import base64
-import random
+import time
 import uuid
+from collections import OrderedDict
+from functools import lru_cache
 from importlib.metadata import version
 from importlib.resources import files
 from json import JSONDecodeError
@@ -10,7 +12,6 @@ from typing import TYPE_CHECKING, Literal
 from unittest.mock import Mock
 
 import httpx
-import hypixel
 import orjson
 
 import mcauth as auth
@@ -45,6 +46,118 @@ if TYPE_CHECKING:
     from proxhy.plugin import ProxhyPlugin
 
 
+# load favicon once at import; it's the same for every connection
+# https://github.com/barneygale/quarry/blob/master/quarry/net/server.py/#L356-L357
+# (b64encode doesn't wrap lines, so there are no newlines to strip)
+_FAVICON = "data:image/png;base64," + base64.b64encode(
+    files("assets").joinpath("favicon.png").read_bytes()
+).decode("ascii")
+
+_SERVER_LIST_PING = {
+    "version": {"name": "1.8.9", "protocol": 47},
+    "players": {
+        "max": -41223,
+        "online": 0,
+    },
+    "description": {"text": "why hello there"},
+    "favicon": _FAVICON,
+}
+
+
+# only the motd changes between pings, and it's usually the same few
+# player counts, so keep the packed json for recent ones
+@lru_cache(maxsize=16)
+def _status_response(motd: str) -> bytes:
+    """Pack the Status Response (0x00) body for the given motd."""
+    return String.pack(
+        orjson.dumps({**_SERVER_LIST_PING, "description": {"text": motd}}).decode()
+    )
+
+
+_HANDSHAKE_PROTOCOL_VERSION = VarInt.pack(47)  # 1.8.9
+_HANDSHAKE_NEXT_STATE = VarInt.pack(State.LOGIN.value)
+
+# the login world's join game and spawn position never change
+_LOGIN_JOIN_GAME = b"".join(
+    (
+        Int.pack(0),  # entity id
+        UnsignedByte.pack(3),  # gamemode: spectator
+        Byte.pack(b"\x01"),  # dimension: the end
+        UnsignedByte.pack(0),  # difficulty: peaceful
+        UnsignedByte.pack(1),  # max players
+        String.pack("default"),  # level type
+        Boolean.pack(True),  # reduced debug info
+    )
+)
+_LOGIN_POSITION_AND_LOOK = b"".join(
+    (
+        Double.pack(0),  # x
+        Double.pack(0),  # y
+        Double.pack(0),  # z
+        Float.pack(0),  # yaw
+        Float.pack(0),  # pitch
+        Byte.pack(b"\x00"),  # flags
+    )
+)
+
+
+_session_server_http: httpx.AsyncClient | None = None
+_mojang_api_http: httpx.AsyncClient | None = None
+
+
+def _session_server_client() -> httpx.AsyncClient:
+    """Shared client for sessionserver joins, so logins reuse its connection."""
+    global _session_server_http
+    if _session_server_http is None:
+        _session_server_http = httpx.AsyncClient(verify=False)
+    return _session_server_http
+
+
+def _mojang_api_client() -> httpx.AsyncClient:
+    """Shared client for api.mojang.com lookups; unlike joins, this one verifies."""
+    global _mojang_api_http
+    if _mojang_api_http is None:
+        _mojang_api_http = httpx.AsyncClient()
+    return _mojang_api_http
+
+
+async def close_mojang_clients() -> None:
+    """Close the shared Mojang clients; called once the proxy shuts down."""
+    global _session_server_http, _mojang_api_http
+    clients = (_session_server_http, _mojang_api_http)
+    _session_server_http = _mojang_api_http = None
+    for client in clients:
+        if client is not None:
+            await client.aclose()
+
+
+_UUID_TTL = 3600  # seconds
+_UUID_CACHE_SIZE = 256
+# casefolded username -> (expiry, uuid), least recently used first
+_uuid_cache: OrderedDict[str, tuple[float, uuid.UUID]] = OrderedDict()
+
+
+async def _resolve_uuid(username: str) -> uuid.UUID:
+    """Look up a username's UUID with Mojang, caching it for _UUID_TTL."""
+    key = username.casefold()
+    cached = _uuid_cache.get(key)
+    if cached is not None:
+        if cached[0] > time.monotonic():
+            _uuid_cache.move_to_end(key)
+            return cached[1]
+        del _uuid_cache[key]
+
+    response = await _mojang_api_client().get(
+        f"https://api.mojang.com/users/profiles/minecraft/{username}", timeout=5
+    )
+    response.raise_for_status()
+    uuid_ = uuid.UUID(response.json()["id"])
+    _uuid_cache[key] = (time.monotonic() + _UUID_TTL, uuid_)
+    if len(_uuid_cache) > _UUID_CACHE_SIZE:
+        _uuid_cache.popitem(last=False)
+    return uuid_
+
+
 class LoginPlugin:
     def _init_login(self: ProxhyPlugin):
         self.logged_in = False
@@ -53,24 +166,6 @@ class LoginPlugin:
         self.device_code_task = None
         self.transferring_to_server = False
 
-        # load favicon
-        # https://github.com/barneygale/quarry/blob/master/quarry/net/server.py/#L356-L357
-        favicon_path = files("assets").joinpath("favicon.png")
-        with favicon_path.open("rb") as file:
-            b64_favicon = (
-                base64.encodebytes(file.read()).decode("ascii").replace("\n", "")
-            )
-
-        self.server_list_ping = {
-            "version": {"name": "1.8.9", "protocol": 47},
-            "players": {
-                "max": -41223,
-                "online": 0,
-            },
-            "description": {"text": "why hello there"},
-            "favicon": f"data:image/png;base64,{b64_favicon}",
-        }
-
         self.access_token = ""
         self.secret: bytes = b""
 
@@ -172,11 +267,14 @@ class LoginPlugin:
     async def packet_login_start(self: ProxhyPlugin, buff: Buffer):
         self.username = buff.unpack(String)
 
-        if not auth.user_exists(self.username):
+        # one read of the credential store instead of one per check
+        status = auth.auth_status(self.username)
+
+        if status == "missing":
             self.logger.debug(f"user {self.username} does not exist; logging in")
             return await self.login()
 
-        if auth.token_needs_refresh(self.username):
+        if status == "needs_refresh":
             self.logger.debug(
                 f"user {self.username} needs a token refresh; regenerating credentials"
             )
@@ -215,10 +313,10 @@ class LoginPlugin:
 
         self.upstream.send_packet(
             0x00,
-            VarInt.pack(47),
+            _HANDSHAKE_PROTOCOL_VERSION,
             String.pack(self.FAKE_CONNECT_HOST[0]),
             UnsignedShort.pack(self.FAKE_CONNECT_HOST[1]),
-            VarInt.pack(State.LOGIN.value),
+            _HANDSHAKE_NEXT_STATE,
         )
 
         if self.CONNECT_HOST[0] not in {"localhost", "127.0.0.1", "::1"}:
@@ -331,10 +429,13 @@ class LoginPlugin:
             )
 
     async def login_keep_alive(self: ProxhyPlugin):
+        # the id only has to be echoed back, so a counter will do
+        keep_alive_id = 0
         while True:
             await asyncio.sleep(10)
             if self.state == State.PLAY and self.downstream.open and self.logging_in:
-                self.downstream.send_packet(0x00, VarInt.pack(random.randint(0, 256)))
+                keep_alive_id = (keep_alive_id + 1) & 0xFF
+                self.downstream.send_packet(0x00, VarInt.pack(keep_alive_id))
             else:
                 self.logger.debug(
                     f"{self.state=}, {self.downstream.open=}, {self.logging_in=}; closing"
@@ -370,8 +471,7 @@ class LoginPlugin:
             )
         except RuntimeError:
             try:
-                async with hypixel.Client(timeout=5) as c:
-                    uuid_ = uuid.UUID(await c.get_uuid(self.username))
+                uuid_ = await _resolve_uuid(self.username)
             except Exception as e:
                 self.downstream.send_packet(
                     0x40,
@@ -389,26 +489,8 @@ class LoginPlugin:
             String.pack(self.username),
         )
 
-        self.downstream.send_packet(
-            0x01,
-            Int.pack(0),
-            UnsignedByte.pack(3),
-            Byte.pack(b"\x01"),
-            UnsignedByte.pack(0),
-            UnsignedByte.pack(1),
-            String.pack("default"),
-            Boolean.pack(True),
-        )
-
-        self.downstream.send_packet(
-            0x08,
-            Double.pack(0),
-            Double.pack(0),
-            Double.pack(0),
-            Float.pack(0),
-            Float.pack(0),
-            Byte.pack(b"\x00"),
-        )
+        self.downstream.send_packet(0x01, _LOGIN_JOIN_GAME)
+        self.downstream.send_packet(0x08, _LOGIN_POSITION_AND_LOOK)
 
         self.keep_alive_task = self.create_task(self.login_keep_alive())
 
@@ -491,10 +573,7 @@ class LoginPlugin:
         else:
             motd = f"§e§l{response.text}§r§7 player{'' if response.text == '1' else 's'} currently online."
 
-        self.server_list_ping["description"] = {"text": motd}
-        self.downstream.send_packet(
-            0x00, String.pack(orjson.dumps(self.server_list_ping).decode())
-        )
+        self.downstream.send_packet(0x00, _status_response(motd))
 
     @listen_client(0x01, State.STATUS, blocking=True)
     async def packet_ping_request(self: ProxhyPlugin, buff: Buffer):
@@ -513,6 +592,11 @@ class LoginPlugin:
     async def packet_encryption_request(self: ProxhyPlugin, buff: Buffer):
         server_id = buff.unpack(String).encode("utf-8")
         public_key = buff.unpack(ByteArray)
+        verify_token = buff.unpack(ByteArray)
+
+        # doesn't depend on the secret, so encrypt it while a cached
+        # secret_task may still be waiting on mojang
+        encrypted_verify_token = pkcs1_v15_padded_rsa_encrypt(public_key, verify_token)
 
         if self.secret_task:
             self.secret = await self.secret_task
@@ -523,26 +607,19 @@ class LoginPlugin:
         # spent a while (not really) making this work and also
         # it works on other servers which technically doesn't matter, but still...
         async with Cache() as cache:
-            if self.CONNECT_HOST not in cache or cache[self.CONNECT_HOST] != (
-                server_id,
-                public_key,
-            ):
+            cache_hit = cache.get(self.CONNECT_HOST) == (server_id, public_key)
+            if not cache_hit:
                 # if server_id/public_key are not cached
                 # OR if the cache is incorrect
                 cache[self.CONNECT_HOST] = (server_id, public_key)
-                self.secret = await self._session_encrypt(server_id, public_key)
 
-        # here, self.secret SHOULD be set from either packet_login_start (cached)
-        # or above conditions
-
-        if not self.secret:
-            # but for whatever reason if we still do not have the secret
+        # on a cache hit, self.secret SHOULD already be set from packet_login_start;
+        # otherwise it was made for the wrong server details (or not at all).
+        # either way mojang is only asked once, and not while holding the cache
+        if not cache_hit or not self.secret:
             self.secret = await self._session_encrypt(server_id, public_key)
 
-        verify_token = buff.unpack(ByteArray)
-
         encrypted_secret = pkcs1_v15_padded_rsa_encrypt(public_key, self.secret)
-        encrypted_verify_token = pkcs1_v15_padded_rsa_encrypt(public_key, verify_token)
 
         self.upstream.send_packet(
             0x01,
@@ -571,16 +648,13 @@ class LoginPlugin:
             "selectedProfile": str(self.uuid),
             "serverId": generate_verification_hash(server_id, secret, public_key),
         }
-        async with httpx.AsyncClient(verify=False) as client:
-            response = await client.post(
-                "https://sessionserver.mojang.com/session/minecraft/join",
-                json=payload,
-            )
-            if response.status_code != 204:
-                # TODO: log
-                raise Exception(
-                    f"Login failed: {response.status_code} {response.json()}"
-                )
+        response = await _session_server_client().post(
+            "https://sessionserver.mojang.com/session/minecraft/join",
+            json=payload,
+        )
+        if response.status_code != 204:
+            # TODO: log
+            raise Exception(f"Login failed: {response.status_code} {response.json()}")
 
         return secret
 
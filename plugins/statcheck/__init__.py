@@ -1254,8 +1254,8 @@ class StatCheckPlugin:
     ):
         message = buff.unpack(Chat)
 
-        if not self.received_who.is_set():
-            self.received_who.set()
+        if not self.received_who:
+            self.received_who = True
         else:
             self.downstream.send_packet(0x02, buff.getvalue())
 
@@ -1317,7 +1317,7 @@ class StatCheckPlugin:
         self._seraph_stats_queue.put_nowait(self_game_player)
 
         self.upstream.send_packet(0x01, String.pack("/who"))
-        self.received_who.clear()
+        self.received_who = False
 
         self.game.started = True
 
@@ -1340,7 +1340,7 @@ class StatCheckPlugin:
         if message in {msg_set[-2] for msg_set in GAME_START_MESSAGE_SETS}:  # runs once
             self.create_task(self.highlight_adjacent_teams())
             self.upstream.chat("/who")
-            self.received_who.clear()
+            self.received_who = False
             self.game.started = True
 
     @command("resetkey")
@@ -1544,14 +1544,16 @@ class StatCheckPlugin:
 
     @subscribe(f"chat:server:{'|'.join(KILL_MSGS)}")
     async def _statcheck_event_chat_server_kill_msg(
-        self: ProxhyPlugin, _match, buff: Buffer
+        self: ProxhyPlugin, match: re.Match, buff: Buffer
     ):
         self.downstream.send_packet(0x02, buff.getvalue())
 
         if not self.in_bedwars_game():
             return
 
-        message = buff.clone().unpack(Chat)
+        # the event name already holds the plain text; buff is kept
+        # for the formatted component only
+        message = match.string.removeprefix("chat:server:")
         fmted_message = Chat.unpack_component(buff).to_legacy()
 
         if message.startswith("BED DESTRUCTION >"):
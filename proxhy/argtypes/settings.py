@@ -183,12 +183,13 @@ class SettingValue(CommandArg):
         actual states. Otherwise, suggests common values (ON, OFF).
         """
         setting_path = await ctx.get_arg(SettingPath)
+        partial_lower = partial.lower()
 
         if setting_path is not None:
             # Suggest from the setting's actual allowed states
             states = list(setting_path.setting.states.keys())
-            return [s for s in states if s.lower().startswith(partial.lower())]
+            return [s for s in states if s.lower().startswith(partial_lower)]
 
         # Fallback to common values
         common = ["ON", "OFF"]
-        return [v for v in common if v.lower().startswith(partial.lower())]
+        return [v for v in common if v.lower().startswith(partial_lower)]
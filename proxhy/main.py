@@ -13,6 +13,7 @@ from platformdirs import user_log_path
 
 import mcauth as auth
 from petty.endpoints import Proxy
+from plugins.login import close_mojang_clients
 from proxhy.proxhy import Proxhy
 from proxhy.utils import zero_pad_calver
 
@@ -224,6 +225,7 @@ async def shutdown(loop: asyncio.AbstractEventLoop, server: ProxhyServer, _):
         if pending:
             await asyncio.gather(*pending, return_exceptions=True)
 
+        await close_mojang_clients()
         print("done!")
         loop.stop()
         return
@@ -287,6 +289,7 @@ async def shutdown(loop: asyncio.AbstractEventLoop, server: ProxhyServer, _):
         await server.wait_closed()
         print("done!")
 
+    await close_mojang_clients()
     loop.stop()
 
 
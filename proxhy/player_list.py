@@ -24,39 +24,74 @@ class PlayerList:
 
     DB_PATH: Path = Path(user_config_dir("proxhy")) / "player_lists.db"
 
+    # {key: {lower_name: entry}}, loaded from the DB once per key and kept
+    # in sync by add/remove so lookups don't reopen the shelf; dropped
+    # whenever the DB files change on disk (e.g. another proxhy process)
+    _cache: dict[str, dict[str, tuple[str, str, str]]] = {}
+    _cache_mtime: int = 0
+
     def __init__(self, key: str):
         self.key = key
 
+    @classmethod
+    def _db_mtime(cls) -> int:
+        # dbm backends differ in which files they create next to DB_PATH
+        mtime = 0
+        for suffix in ("", ".db", ".dat", ".dir"):
+            try:
+                stat = cls.DB_PATH.with_name(cls.DB_PATH.name + suffix).stat()
+            except OSError:
+                continue
+            mtime = max(mtime, stat.st_mtime_ns)
+        return mtime
+
+    def _entries(self) -> dict[str, tuple[str, str, str]]:
+        if (mtime := self._db_mtime()) != PlayerList._cache_mtime:
+            PlayerList._cache.clear()
+            PlayerList._cache_mtime = mtime
+
+        players = self._cache.get(self.key)
+        if players is None:
+            with shelve.open(str(self.DB_PATH)) as db:
+                raw = db.get(self.key, {})
+            players = self._cache[self.key] = {
+                k: (v[0], v[1], v[2] if len(v) > 2 else "") for k, v in raw.items()
+            }
+        return players
+
+    def _save(self, players: dict[str, tuple[str, str, str]]) -> None:
+        with shelve.open(str(self.DB_PATH)) as db:
+            db[self.key] = players
+        # our own write: only this key is known to match the DB now
+        for key in PlayerList._cache.keys() - {self.key}:
+            del PlayerList._cache[key]
+        PlayerList._cache_mtime = self._db_mtime()
+
     def all(self) -> dict[str, tuple[str, str, str]]:
         """Return {lower_name: (proper_name, display_str, uuid)}."""
-        with shelve.open(str(self.DB_PATH)) as db:
-            raw = db.get(self.key, {})
-            return {k: (v[0], v[1], v[2] if len(v) > 2 else "") for k, v in raw.items()}
+        return self._entries().copy()
 
     def contains(self, name: str) -> bool:
-        with shelve.open(str(self.DB_PATH)) as db:
-            return name.lower() in db.get(self.key, {})
+        return name.lower() in self._entries()
 
     def contains_uuid(self, uuid: str) -> bool:
-        return any(entry[2] == uuid for entry in self.all().values())
+        return any(entry[2] == uuid for entry in self._entries().values())
 
     def add(self, name: str, display: str, uuid: str = "") -> None:
-        with shelve.open(str(self.DB_PATH)) as db:
-            players = db.get(self.key, {})
-            players[name.lower()] = (name, display, uuid)
-            db[self.key] = players
+        players = self._entries()
+        players[name.lower()] = (name, display, uuid)
+        self._save(players)
 
     def remove(self, name: str) -> tuple[str, str, str]:
         """Remove and return (proper_name, display_str, uuid). Raises KeyError if not found."""
-        with shelve.open(str(self.DB_PATH)) as db:
-            players = db.get(self.key, {})
-            result = players.pop(name.lower())
-            db[self.key] = players
-            return result
+        players = self._entries()
+        result = players.pop(name.lower())
+        self._save(players)
+        return result
 
     def names(self) -> list[str]:
         """Return sorted list of properly-capitalized player names."""
-        return sorted(v[0] for v in self.all().values())
+        return sorted(v[0] for v in self._entries().values())
 
 
 class PlayerListSystem:
@@ -1,11 +1,14 @@
+import logging
 from dataclasses import dataclass
 from typing import Literal
 
 from assets import load_json_asset
 from proxhy.argtypes.hypixel import GAMETYPE_T
 
+logger = logging.getLogger("proxhy")
 
-@dataclass
+
+@dataclass(slots=True)
 class BedwarsMap:
     name: str
     rush_direction: Literal["main", "alt"] | None = None
@@ -36,7 +39,17 @@ def _load_bedwars_maps():
 _load_bedwars_maps()
 
 
-@dataclass
+# (field, value) pairs cleared by Game.update before applying a locraw
+_GAME_RESET: tuple[tuple[str, object], ...] = (
+    ("server", ""),
+    ("gametype", ""),
+    ("mode", ""),
+    ("map", None),
+    ("lobbyname", ""),
+)
+
+
+@dataclass(slots=True)
 class Game:
     server: str = ""
     gametype: GAMETYPE_T | Literal[""] = ""
@@ -47,20 +60,22 @@ class Game:
 
     def __setattr__(self, name: str, value) -> None:
         if isinstance(value, str):
-            super().__setattr__(name.casefold(), value.casefold())
+            object.__setattr__(self, name.casefold(), value.casefold())
         else:
-            super().__setattr__(name, value)
+            object.__setattr__(self, name, value)
 
     def update(self, data: dict):
-        # reset
-        self.server = ""
-        self.gametype = ""
-        self.mode = ""
-        self.map = None
-        self.lobbyname = ""
+        # reset; the defaults are already casefolded, so skip __setattr__
+        for name, value in _GAME_RESET:
+            object.__setattr__(self, name, value)
 
         for key, value in data.items():
-            if key != "map":
-                setattr(self, key, value)
-            else:
+            if key == "map":
                 self.map = _MAPS.get(value.lower())
+            elif key in _GAME_FIELDS:
+                setattr(self, key, value)
+            else:  # slotted, so there's nowhere to put keys we don't track
+                logger.debug(f"ignoring unknown locraw key {key!r}={value!r}")
+
+
+_GAME_FIELDS = frozenset(Game.__slots__)